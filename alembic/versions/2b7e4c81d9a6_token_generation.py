@@ -0,0 +1,30 @@
+"""token generation
+
+Revision ID: 2b7e4c81d9a6
+Revises: 9a3f6d0c2e71
+Create Date: 2026-10-17 17:45:12.604931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7e4c81d9a6'
+down_revision: Union[str, Sequence[str], None] = '9a3f6d0c2e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_generation', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('refresh_tokens', sa.Column('generation', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('refresh_tokens', 'generation')
+    op.drop_column('users', 'token_generation')
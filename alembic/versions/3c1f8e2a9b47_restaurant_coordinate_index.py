@@ -0,0 +1,28 @@
+"""restaurant coordinate index
+
+Revision ID: 3c1f8e2a9b47
+Revises: fa93ba963071
+Create Date: 2026-10-17 10:12:04.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f8e2a9b47'
+down_revision: Union[str, Sequence[str], None] = 'fa93ba963071'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_restaurants_latitude_longitude', 'restaurants', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_restaurants_latitude_longitude', table_name='restaurants')
@@ -0,0 +1,31 @@
+"""food variant and specification positions
+
+Revision ID: 6e1d8b3f4a29
+Revises: 2b7e4c81d9a6
+Create Date: 2026-10-17 19:12:30.447815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e1d8b3f4a29'
+down_revision: Union[str, Sequence[str], None] = '2b7e4c81d9a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows all start at 0, reads break ties by id so their order is unchanged
+    op.add_column('food_variants', sa.Column('position', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('food_specifications', sa.Column('position', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('food_specifications', 'position')
+    op.drop_column('food_variants', 'position')
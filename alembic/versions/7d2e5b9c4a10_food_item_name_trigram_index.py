@@ -0,0 +1,36 @@
+"""food item name trigram index
+
+Revision ID: 7d2e5b9c4a10
+Revises: 3c1f8e2a9b47
+Create Date: 2026-10-17 11:03:47.220914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e5b9c4a10'
+down_revision: Union[str, Sequence[str], None] = '3c1f8e2a9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_food_items_name_trgm',
+        'food_items',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_food_items_name_trgm', table_name='food_items')
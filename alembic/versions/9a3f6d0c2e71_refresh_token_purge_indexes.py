@@ -0,0 +1,36 @@
+"""refresh token purge indexes
+
+Revision ID: 9a3f6d0c2e71
+Revises: c5d92a7e1b08
+Create Date: 2026-10-17 16:20:08.914377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f6d0c2e71'
+down_revision: Union[str, Sequence[str], None] = 'c5d92a7e1b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+    op.create_index(
+        'ix_refresh_tokens_revoked',
+        'refresh_tokens',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('is_revoked'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_refresh_tokens_revoked', table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
@@ -0,0 +1,28 @@
+"""food variant item index
+
+Revision ID: b81f04d6e3c2
+Revises: 7d2e5b9c4a10
+Create Date: 2026-10-17 11:41:19.804371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f04d6e3c2'
+down_revision: Union[str, Sequence[str], None] = '7d2e5b9c4a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_food_variants_food_item_id'), 'food_variants', ['food_item_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_food_variants_food_item_id'), table_name='food_variants')
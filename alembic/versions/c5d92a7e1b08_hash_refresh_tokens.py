@@ -0,0 +1,38 @@
+"""hash refresh tokens
+
+Revision ID: c5d92a7e1b08
+Revises: e4a7c3d19f52
+Create Date: 2026-10-17 15:02:41.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d92a7e1b08'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c3d19f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    # Same digest as app.core.security.hash_refresh_token, so issued tokens keep working
+    op.execute("UPDATE refresh_tokens SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+    op.drop_column('refresh_tokens', 'token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Plaintext tokens can't be recovered: every carried-over row is revoked
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token = token_hash, is_revoked = true")
+    op.alter_column('refresh_tokens', 'token', nullable=False)
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
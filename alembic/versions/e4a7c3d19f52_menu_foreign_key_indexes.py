@@ -0,0 +1,30 @@
+"""menu foreign key indexes
+
+Revision ID: e4a7c3d19f52
+Revises: b81f04d6e3c2
+Create Date: 2026-10-17 13:26:52.107648
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c3d19f52'
+down_revision: Union[str, Sequence[str], None] = 'b81f04d6e3c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_food_items_restaurant_id'), 'food_items', ['restaurant_id'], unique=False)
+    op.create_index(op.f('ix_food_specifications_food_item_id'), 'food_specifications', ['food_item_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_food_specifications_food_item_id'), table_name='food_specifications')
+    op.drop_index(op.f('ix_food_items_restaurant_id'), table_name='food_items')
@@ -0,0 +1,75 @@
+"""
+Pick Argon2 parameters that meet a per-hash latency budget on this host.
+
+Keeps the memory cost unless a single pass is already over budget, then
+raises the time cost as far as the budget allows. Run it on each
+instance type and set the printed variables in that deployment's env:
+
+    python -m app.core.argon2_calibration --target-ms 250
+"""
+import argparse
+import os
+import statistics
+import time
+
+from passlib.hash import argon2
+
+
+ARGON2_TARGET_MS = float(os.getenv("ARGON2_TARGET_MS", 250))
+ARGON2_MIN_MEMORY_COST = 8192  # KiB
+ARGON2_MAX_TIME_COST = 20
+CALIBRATION_SAMPLES = 5
+
+
+def measure_ms(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    """Median wall time of one hash with these parameters."""
+    hasher = argon2.using(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    timings = []
+
+    for _ in range(CALIBRATION_SAMPLES):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1000
+
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int):
+    """Returns (time_cost, memory_cost, measured_ms)."""
+    measured = measure_ms(1, memory_cost, parallelism)
+
+    # Only give up memory hardness when one pass can't fit the budget
+    while measured > target_ms and memory_cost > ARGON2_MIN_MEMORY_COST:
+        memory_cost = max(memory_cost // 2, ARGON2_MIN_MEMORY_COST)
+        measured = measure_ms(1, memory_cost, parallelism)
+
+    time_cost = 1
+    while time_cost < ARGON2_MAX_TIME_COST:
+        next_measured = measure_ms(time_cost + 1, memory_cost, parallelism)
+        if next_measured > target_ms:
+            break
+        time_cost, measured = time_cost + 1, next_measured
+
+    return time_cost, memory_cost, measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=ARGON2_TARGET_MS)
+    parser.add_argument("--memory-cost", type=int,
+                        default=int(os.getenv("ARGON2_MEMORY_COST", argon2.memory_cost)),
+                        help="starting memory cost in KiB")
+    parser.add_argument("--parallelism", type=int,
+                        default=int(os.getenv("ARGON2_PARALLELISM", argon2.parallelism)))
+    args = parser.parse_args()
+
+    time_cost, memory_cost, measured = calibrate(args.target_ms, args.memory_cost, args.parallelism)
+
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={args.parallelism}")
+    print(f"# {measured:.0f} ms per hash on this host (target {args.target_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
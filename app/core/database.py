@@ -1,5 +1,7 @@
 import os
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
@@ -12,6 +14,8 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set")
 
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB_ENABLED", "false").lower() == "true"
+
 engine = create_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(
@@ -20,6 +24,25 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine (asyncpg) for I/O-bound read routes
+async_engine = None
+AsyncSessionLocal = None
+
+if ASYNC_DB_ENABLED:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or make_url(DATABASE_URL).set(
+        drivername="postgresql+asyncpg"
+    )
+
+    async_engine = create_async_engine(ASYNC_DATABASE_URL)
+
+    AsyncSessionLocal = async_sessionmaker(
+        autoflush=False,
+        expire_on_commit=False,
+        bind=async_engine
+    )
+
 # CREATE TABLES
 #Base.metadata.create_all(bind=engine)
 
@@ -30,3 +53,120 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async Dependency
+async def get_async_db():
+    """
+    AsyncSession when ASYNC_DB_ENABLED, otherwise a regular Session.
+
+    Routes using it are ``async def`` and run their queries through
+    ``run_db``, so the same code serves both modes.
+    """
+    if AsyncSessionLocal is None:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
+        return
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def run_db(db, fn, *args):
+    """
+    Run ``fn(session, *args)`` without blocking the event loop.
+
+    An AsyncSession runs it through ``run_sync``, where queries and lazy
+    loads await asyncpg instead of holding a thread. A sync Session runs
+    it in the threadpool, as a sync route would.
+    """
+    if AsyncSessionLocal is not None:
+        return await db.run_sync(fn, *args)
+
+    return await run_in_threadpool(fn, db, *args)
+
+
+# -------------------------
+# Read-Only Rows
+# -------------------------
+def row_columns(model, *names) -> list:
+    """Table columns of ``model``, all of them when no names are given."""
+    columns = model.__table__.c
+    if not names:
+        return list(columns)
+    return [columns[name] for name in names]
+
+
+def read_rows(db, statement) -> list:
+    """
+    Run a column select on the session's connection and return its rows.
+
+    Rows are plain named tuples: nothing goes into the identity map and
+    there is no attribute instrumentation or relationship collection to
+    build and then throw away. For read-only endpoints that only
+    serialize what they load; ``statement`` should select columns, not
+    entities.
+    """
+    return db.connection().execute(statement).all()
+
+
+def read_row(db, statement):
+    """First row of ``statement`` (see ``read_rows``), or None."""
+    return db.connection().execute(statement).first()
+
+
+# Clients asking for this get exports streamed via stream_rows
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def stream_rows(db, statement, encode, chunk_size: int):
+    """
+    Iterate ``statement`` as chunks of ``encode(row)`` strings.
+
+    Meant for a StreamingResponse: rows are fetched ``chunk_size`` at a
+    time from a server-side cursor, so the first bytes go out before
+    the whole result is read. Yields nothing when ``statement`` is None.
+    """
+    if AsyncSessionLocal is not None:
+        return _stream_rows_async(db, statement, encode, chunk_size)
+
+    return _stream_rows(db, statement, encode, chunk_size)
+
+
+def _stream_rows(db, statement, encode, chunk_size: int):
+    if statement is None:
+        return
+
+    lines = []
+    statement = statement.execution_options(yield_per=chunk_size)
+
+    for row in db.execute(statement):
+        lines.append(encode(row))
+
+        if len(lines) >= chunk_size:
+            yield "".join(lines)
+            lines = []
+
+    if lines:
+        yield "".join(lines)
+
+
+async def _stream_rows_async(db, statement, encode, chunk_size: int):
+    if statement is None:
+        return
+
+    lines = []
+    result = await db.stream(statement.execution_options(yield_per=chunk_size))
+
+    async for row in result:
+        lines.append(encode(row))
+
+        if len(lines) >= chunk_size:
+            yield "".join(lines)
+            lines = []
+
+    if lines:
+        yield "".join(lines)
@@ -0,0 +1,83 @@
+import os
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+FAST_JSON_ENABLED = os.getenv("FAST_JSON_ENABLED", "false").lower() == "true"
+
+
+# -------------------------
+# Response Class
+# -------------------------
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson, for payloads that are plain dicts."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content)
+
+
+# -------------------------
+# Payload Builders
+# -------------------------
+# Each builder mirrors a response model in app/schemas field for field,
+# coercing the same types pydantic would (tests/test_fast_json.py).
+
+def variant_payload(row) -> dict:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "price": float(row.price)
+    }
+
+
+def specification_payload(row) -> dict:
+    return {
+        "id": row.id,
+        "label": row.label,
+        "value": row.value
+    }
+
+
+def menu_item_payload(item, variants, specifications) -> dict:
+    return {
+        "id": item.id,
+        "name": item.name,
+        "description": item.description,
+        "rating": float(item.rating),
+        "is_available": bool(item.is_available),
+        "restaurant_id": item.restaurant_id,
+        "created_at": item.created_at,
+        "variants": [variant_payload(v) for v in variants],
+        "specifications": [specification_payload(s) for s in specifications]
+    }
+
+
+def restaurant_menu_payload(restaurant, items, variants, specifications) -> dict:
+    variants_by_item = {}
+    for variant in variants:
+        variants_by_item.setdefault(variant.food_item_id, []).append(variant)
+
+    specs_by_item = {}
+    for spec in specifications:
+        specs_by_item.setdefault(spec.food_item_id, []).append(spec)
+
+    return {
+        "restaurant_id": restaurant.id,
+        "restaurant_name": restaurant.name,
+        "phone": restaurant.phone,
+        "latitude": float(restaurant.latitude),
+        "longitude": float(restaurant.longitude),
+        "menu": [
+            menu_item_payload(
+                item,
+                variants_by_item.get(item.id, []),
+                specs_by_item.get(item.id, [])
+            )
+            for item in items
+        ]
+    }
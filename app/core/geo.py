@@ -0,0 +1,257 @@
+import math
+import os
+import threading
+import time
+
+
+EARTH_RADIUS_KM = 6371
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+GEO_INDEX_ENABLED = os.getenv("GEO_INDEX_ENABLED", "true").lower() == "true"
+GEO_INDEX_CELL_DEG = float(os.getenv("GEO_INDEX_CELL_DEG", 0.05))
+GEO_INDEX_REFRESH_SECONDS = int(os.getenv("GEO_INDEX_REFRESH_SECONDS", 30))
+GEO_INDEX_MAX_CANDIDATES = int(os.getenv("GEO_INDEX_MAX_CANDIDATES", 1000))
+
+
+# -------------------------
+# Distance (same formula as the SQL search)
+# -------------------------
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    cos_angle = (
+        math.cos(math.radians(lat1)) *
+        math.cos(math.radians(lat2)) *
+        math.cos(math.radians(lng2) - math.radians(lng1)) +
+        math.sin(math.radians(lat1)) *
+        math.sin(math.radians(lat2))
+    )
+    return EARTH_RADIUS_KM * math.acos(min(1, max(-1, cos_angle)))
+
+
+# -------------------------
+# Bounding Box
+# -------------------------
+def _degree_spans(lat: float, radius_km: float):
+    """Half-widths in degrees, dlng is None when the circle spans a pole."""
+    # Small pad so rounding never drops a point sitting on the circle
+    dlat = radius_km / KM_PER_DEGREE * 1.000001
+
+    if abs(lat) + dlat >= 90:
+        return dlat, None
+
+    dlng = dlat / math.cos(math.radians(abs(lat) + dlat))
+    if dlng >= 180:
+        return dlat, None
+
+    return dlat, dlng
+
+
+def bounding_box(lat: float, lng: float, radius_km: float):
+    """
+    Lat/lng box enclosing the circle around (lat, lng).
+
+    Returns (min_lat, max_lat, min_lng, max_lng). The longitude bounds
+    are None when the circle spans a pole, and min_lng > max_lng when it
+    crosses the antimeridian.
+    """
+    dlat, dlng = _degree_spans(lat, radius_km)
+    min_lat = max(lat - dlat, -90)
+    max_lat = min(lat + dlat, 90)
+
+    if dlng is None:
+        return min_lat, max_lat, None, None
+
+    min_lng = (lng - dlng + 180) % 360 - 180
+    max_lng = (lng + dlng + 180) % 360 - 180
+
+    return min_lat, max_lat, min_lng, max_lng
+
+
+# -------------------------
+# Grid Cells
+# -------------------------
+def cell_of(lat: float, lng: float, cell_deg: float) -> tuple:
+    columns = round(360 / cell_deg)
+    row = math.floor((min(max(lat, -90), 90) + 90) / cell_deg)
+    col = math.floor((lng + 180) / cell_deg) % columns
+    return row, col
+
+
+def covering_cells(lat: float, lng: float, radius_km: float, cell_deg: float):
+    """
+    Grid cells intersecting the circle around (lat, lng).
+
+    Returns None when the circle spans a pole or half the globe in
+    longitude, in which case callers should fall back to a full scan.
+    """
+    dlat, dlng = _degree_spans(lat, radius_km)
+    if dlng is None:
+        return None
+
+    columns = round(360 / cell_deg)
+    min_row, min_col = cell_of(lat - dlat, lng - dlng, cell_deg)
+    max_row, _ = cell_of(lat + dlat, lng + dlng, cell_deg)
+    col_span = math.floor((lng + dlng + 180) / cell_deg) - math.floor((lng - dlng + 180) / cell_deg)
+
+    return [
+        (row, (min_col + offset) % columns)
+        for row in range(min_row, max_row + 1)
+        for offset in range(col_span + 1)
+    ]
+
+
+# -------------------------
+# In-Process Restaurant Index
+# -------------------------
+class RestaurantGeoIndex:
+    """
+    Uniform grid of active restaurant coordinates, kept per process.
+
+    Loaded lazily from the database and reloaded every
+    ``refresh_seconds``. Restaurant write paths call ``upsert``/``remove``
+    so this process sees its own writes at once; a restaurant created,
+    activated or moved through another worker is missing from (or
+    misplaced in) this one's searches for up to ``refresh_seconds``.
+    Deactivations and deletions are safe sooner, since the search query
+    still checks the row itself.
+    """
+
+    def __init__(self, cell_deg: float, refresh_seconds: int, max_candidates: int):
+        self.cell_deg = cell_deg
+        self.refresh_seconds = refresh_seconds
+        self.max_candidates = max_candidates
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._points = {}
+        self._cells = {}
+        self._loaded_at = None
+        self._ready = False
+        self._generation = 0
+        self._replay = None
+
+    def ensure_loaded(self, db):
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.refresh_seconds:
+            return
+
+        # One reload at a time; once an index exists, others keep serving it
+        if not self._load_lock.acquire(blocking=not self._ready):
+            return
+
+        try:
+            loaded_at = self._loaded_at
+            if loaded_at is not None and time.monotonic() - loaded_at < self.refresh_seconds:
+                return
+
+            with self._lock:
+                generation = self._generation
+                self._replay = []
+
+            points, cells = self._build(db)
+
+            with self._lock:
+                self._points = points
+                self._cells = cells
+
+                # Writes that raced the load are applied on top of it
+                for args in self._replay:
+                    self._discard(args[0])
+                    if args[1] is not None:
+                        self._add(*args)
+                self._replay = None
+
+                self._ready = True
+                if generation == self._generation:
+                    self._loaded_at = time.monotonic()
+        finally:
+            self._load_lock.release()
+
+    def _build(self, db):
+        """Fresh points and cells from the database, built without holding ``_lock``."""
+        from app.models.restaurant import Restaurant
+
+        rows = (
+            db.query(Restaurant.id, Restaurant.latitude, Restaurant.longitude)
+            .filter(Restaurant.is_active == True)
+            .all()
+        )
+
+        points = {}
+        cells = {}
+        for restaurant_id, lat, lng in rows:
+            points[restaurant_id] = (lat, lng)
+            cells.setdefault(cell_of(lat, lng, self.cell_deg), set()).add(restaurant_id)
+
+        return points, cells
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def upsert(self, restaurant_id: int, lat: float, lng: float, is_active: bool = True):
+        with self._lock:
+            self._discard(restaurant_id)
+            if is_active:
+                self._add(restaurant_id, lat, lng)
+            if self._replay is not None:
+                self._replay.append((restaurant_id, lat, lng) if is_active else (restaurant_id, None, None))
+
+    def remove(self, restaurant_id: int):
+        with self._lock:
+            self._discard(restaurant_id)
+            if self._replay is not None:
+                self._replay.append((restaurant_id, None, None))
+
+    def _add(self, restaurant_id: int, lat: float, lng: float):
+        self._points[restaurant_id] = (lat, lng)
+        self._cells.setdefault(cell_of(lat, lng, self.cell_deg), set()).add(restaurant_id)
+
+    def _discard(self, restaurant_id: int):
+        point = self._points.pop(restaurant_id, None)
+        if point is None:
+            return
+
+        cell = cell_of(point[0], point[1], self.cell_deg)
+        members = self._cells.get(cell)
+        if members is not None:
+            members.discard(restaurant_id)
+            if not members:
+                del self._cells[cell]
+
+    def candidates(self, lat: float, lng: float, radius_km: float):
+        """
+        Ids of active restaurants within ``radius_km`` of (lat, lng).
+
+        Returns None past ``max_candidates``, where an IN list would cost
+        more than the bounding-box query it is meant to narrow.
+        """
+        cells = covering_cells(lat, lng, radius_km, self.cell_deg)
+
+        with self._lock:
+            if cells is None or len(cells) > len(self._cells):
+                ids = list(self._points)
+            else:
+                ids = [
+                    restaurant_id
+                    for cell in cells
+                    for restaurant_id in self._cells.get(cell, ())
+                ]
+            points = [(restaurant_id, self._points[restaurant_id]) for restaurant_id in ids]
+
+        found = [
+            restaurant_id
+            for restaurant_id, (r_lat, r_lng) in points
+            if distance_km(lat, lng, r_lat, r_lng) <= radius_km
+        ]
+
+        if len(found) > self.max_candidates:
+            return None
+
+        return found
+
+
+restaurant_index = RestaurantGeoIndex(
+    GEO_INDEX_CELL_DEG,
+    GEO_INDEX_REFRESH_SECONDS,
+    GEO_INDEX_MAX_CANDIDATES
+)
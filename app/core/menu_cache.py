@@ -0,0 +1,80 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+MENU_CACHE_MAX_ENTRIES = int(os.getenv("MENU_CACHE_MAX_ENTRIES", 1024))
+MENU_CACHE_TTL_SECONDS = int(os.getenv("MENU_CACHE_TTL_SECONDS", 60))
+
+
+class MenuSnapshotCache:
+    """
+    Serialized restaurant menus, cached under a per-restaurant version.
+
+    Menu and restaurant writes call ``bump``, which retires the cached
+    bytes. A snapshot is only stored if the version it was built from is
+    still current, so a read racing a write never caches stale data.
+    The TTL bounds staleness for writes served by other workers.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._snapshots = OrderedDict()
+
+    def version(self, restaurant_id: int) -> int:
+        with self._lock:
+            return self._versions.get(restaurant_id, 0)
+
+    def bump(self, restaurant_id: int):
+        with self._lock:
+            self._versions[restaurant_id] = self._versions.get(restaurant_id, 0) + 1
+            self._snapshots.pop(restaurant_id, None)
+
+    def get(self, restaurant_id: int):
+        """(body, etag) for the current version, or None."""
+        with self._lock:
+            snapshot = self._snapshots.get(restaurant_id)
+            if snapshot is None:
+                return None
+
+            version, body, etag, expires_at = snapshot
+            if version != self._versions.get(restaurant_id, 0) or expires_at <= time.monotonic():
+                del self._snapshots[restaurant_id]
+                return None
+
+            self._snapshots.move_to_end(restaurant_id)
+            return body, etag
+
+    def put(self, restaurant_id: int, version: int, body: bytes):
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+        with self._lock:
+            if version == self._versions.get(restaurant_id, 0):
+                self._snapshots[restaurant_id] = (
+                    version, body, etag, time.monotonic() + self.ttl_seconds
+                )
+                self._snapshots.move_to_end(restaurant_id)
+
+                while len(self._snapshots) > self.max_entries:
+                    self._snapshots.popitem(last=False)
+
+        return body, etag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+menu_cache = MenuSnapshotCache(MENU_CACHE_MAX_ENTRIES, MENU_CACHE_TTL_SECONDS)
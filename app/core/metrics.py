@@ -0,0 +1,68 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# -------------------------
+# Custom Metrics
+# -------------------------
+# Registered on the default registry, so they are served from the
+# /metrics endpoint exposed by the Instrumentator in app.main.
+
+SEARCH_CACHE_HITS = Counter(
+    "search_cache_hits_total",
+    "Search requests answered from the result cache",
+)
+
+SEARCH_CACHE_MISSES = Counter(
+    "search_cache_misses_total",
+    "Search requests that had to run the search query",
+)
+
+SEARCH_CACHE_EVICTIONS = Counter(
+    "search_cache_evictions_total",
+    "Search cache entries removed before being served again",
+    ["reason"],
+)
+
+SEARCH_CACHE_ENTRIES = Gauge(
+    "search_cache_entries",
+    "Entries currently held in the search result cache",
+)
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash jobs waiting for an Argon2 worker",
+)
+
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time password hash jobs spent queued before an Argon2 worker took them",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+PASSWORD_HASH_DURATION_SECONDS = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent computing Argon2 hashes and verifications",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hash jobs turned away because the Argon2 queue was full",
+)
+
+PRINCIPAL_CACHE_HITS = Counter(
+    "principal_cache_hits_total",
+    "Authenticated requests resolved from the principal cache",
+)
+
+PRINCIPAL_CACHE_MISSES = Counter(
+    "principal_cache_misses_total",
+    "Authenticated requests that loaded the user from the database",
+)
+
+LOGIN_THROTTLED = Counter(
+    "login_throttled_total",
+    "Login attempts rejected by the rate limiter before verifying the password",
+    ["scope"],
+)
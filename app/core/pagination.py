@@ -0,0 +1,50 @@
+import base64
+import json
+import math
+
+from fastapi import HTTPException, status
+
+
+# -------------------------
+# Opaque Keyset Cursors
+# -------------------------
+def encode_cursor(*values) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> list:
+    """
+    Values of a cursor made by ``encode_cursor``, one per entry in ``types``.
+
+    Each value must be an instance of its type (``float`` also takes
+    whole numbers, neither takes bools or non-finite numbers), so a
+    crafted cursor is a 400 rather than a failure in the query.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(_is_instance(value, kind) for value, kind in zip(values, types))
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    return values
+
+
+def _is_instance(value, kind: type) -> bool:
+    if isinstance(value, bool):
+        return kind is bool
+
+    if kind is float:
+        return isinstance(value, int) or (isinstance(value, float) and math.isfinite(value))
+
+    return isinstance(value, kind)
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from app.core.metrics import (
+    PASSWORD_HASH_DURATION_SECONDS,
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_REJECTED,
+    PASSWORD_HASH_WAIT_SECONDS,
+)
+
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", max(1, (os.cpu_count() or 2) // 2)))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 32))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", 1))
+
+
+class PasswordHashPool:
+    """
+    Dedicated, bounded executor for Argon2 work.
+
+    argon2-cffi releases the GIL while hashing, so a few threads keep
+    that many cores busy without borrowing the threadpool that serves
+    sync routes. At most ``workers + max_queue`` jobs are admitted; past
+    that, callers get a 503 with Retry-After right away instead of
+    queueing behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="argon2")
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._queued = 0
+
+    async def run(self, operation: str, fn, *args):
+        """Await ``fn(*args)`` on the pool; ``operation`` labels the duration metric."""
+        with self._lock:
+            if self._admitted >= self.workers + self.max_queue:
+                PASSWORD_HASH_REJECTED.inc()
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-in attempts in progress, retry shortly",
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+
+            self._admitted += 1
+            self._queued += 1
+            PASSWORD_HASH_QUEUE_DEPTH.set(self._queued)
+
+        future = self._executor.submit(self._call, operation, time.perf_counter(), fn, args)
+        # Runs for finished and cancelled jobs alike, so no slot is ever leaked
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future):
+        with self._lock:
+            self._admitted -= 1
+
+            # Cancelled while queued, so _call never took it off the queue
+            if future.cancelled():
+                self._queued -= 1
+                PASSWORD_HASH_QUEUE_DEPTH.set(self._queued)
+
+    def _call(self, operation: str, submitted: float, fn, args):
+        started = time.perf_counter()
+        PASSWORD_HASH_WAIT_SECONDS.observe(started - submitted)
+
+        with self._lock:
+            self._queued -= 1
+            PASSWORD_HASH_QUEUE_DEPTH.set(self._queued)
+
+        try:
+            return fn(*args)
+        finally:
+            PASSWORD_HASH_DURATION_SECONDS.labels(operation).observe(time.perf_counter() - started)
+
+
+password_pool = PasswordHashPool(
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_QUEUE,
+    PASSWORD_HASH_RETRY_AFTER
+)
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event
+
+from app.core.metrics import PRINCIPAL_CACHE_HITS, PRINCIPAL_CACHE_MISSES
+from app.models.user import User
+
+
+PRINCIPAL_CACHE_ENABLED = os.getenv("PRINCIPAL_CACHE_ENABLED", "true").lower() == "true"
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000))
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 30))
+
+# Never kept in memory longer than the request that loaded it
+_UNCACHED_COLUMNS = {"password_hash"}
+
+# Revocation and authorization state, read from the database on every hit
+PRINCIPAL_FRESH_COLUMNS = ("token_generation", "role")
+
+
+class PrincipalCache:
+    """
+    LRU + TTL cache of authenticated users, keyed by user id.
+
+    Hits return a transient ``User`` built from the cached columns, not
+    attached to any session. ``PRINCIPAL_FRESH_COLUMNS`` are not cached;
+    callers read them on every hit, so a logout-everywhere, role change
+    or deletion on another worker applies here at once. User updates
+    and deletes flushed by this process drop the entry (see the mapper
+    events below); other profile changes made elsewhere show up within
+    ``ttl_seconds``.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._epoch = 0
+
+    def epoch(self) -> int:
+        """Read before loading a user, then pass to ``put``."""
+        return self._epoch
+
+    def get(self, user_id: int):
+        with self._lock:
+            entry = self._entries.get(user_id)
+
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(user_id, None)
+                PRINCIPAL_CACHE_MISSES.inc()
+                return None
+
+            self._entries.move_to_end(user_id)
+            PRINCIPAL_CACHE_HITS.inc()
+            values = entry[1]
+
+        return User(**values)
+
+    def put(self, user: User, epoch: int):
+        values = {
+            column.key: getattr(user, column.key)
+            for column in User.__table__.columns
+            if column.key not in _UNCACHED_COLUMNS
+            and column.key not in PRINCIPAL_FRESH_COLUMNS
+        }
+
+        with self._lock:
+            # An invalidation raced with the load, the row may be stale
+            if epoch != self._epoch:
+                return
+
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, values)
+            self._entries.move_to_end(user.id)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._epoch += 1
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+# -------------------------
+# Invalidation Hooks
+# -------------------------
+# Bulk query.update()/delete() skip these, call invalidate() after them.
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _drop_cached_principal(mapper, connection, target):
+    principal_cache.invalidate(target.id)
@@ -0,0 +1,87 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request, status
+
+from app.core.metrics import LOGIN_THROTTLED
+
+
+LOGIN_RATE_LIMIT_ENABLED = os.getenv("LOGIN_RATE_LIMIT_ENABLED", "true").lower() == "true"
+LOGIN_RATE_IP_BURST = int(os.getenv("LOGIN_RATE_IP_BURST", 20))
+LOGIN_RATE_IP_PER_MINUTE = float(os.getenv("LOGIN_RATE_IP_PER_MINUTE", 20))
+LOGIN_RATE_EMAIL_BURST = int(os.getenv("LOGIN_RATE_EMAIL_BURST", 5))
+LOGIN_RATE_EMAIL_PER_MINUTE = float(os.getenv("LOGIN_RATE_EMAIL_PER_MINUTE", 1))
+LOGIN_RATE_MAX_KEYS = int(os.getenv("LOGIN_RATE_MAX_KEYS", 100000))
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets per key, kept per process in a bounded LRU.
+
+    Each key may spend ``burst`` attempts at once and regains
+    ``per_minute`` of them every minute. When more than ``max_keys``
+    keys are tracked the least recently seen bucket is dropped, which
+    only ever resets that key to a full bucket.
+    """
+
+    def __init__(self, burst: int, per_minute: float, max_keys: int):
+        self.burst = burst
+        self.rate = per_minute / 60
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+
+    def acquire(self, key, now: float = None) -> float:
+        """Take one token for ``key``; returns 0, or seconds until one is available."""
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / self.rate if self.rate > 0 else math.inf
+
+            self._buckets[key] = (tokens, now)
+
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return wait
+
+
+login_ip_limiter = TokenBucketLimiter(LOGIN_RATE_IP_BURST, LOGIN_RATE_IP_PER_MINUTE, LOGIN_RATE_MAX_KEYS)
+login_email_limiter = TokenBucketLimiter(LOGIN_RATE_EMAIL_BURST, LOGIN_RATE_EMAIL_PER_MINUTE, LOGIN_RATE_MAX_KEYS)
+
+
+def client_ip(request: Request) -> str:
+    # nginx sets X-Real-IP, direct connections fall back to the socket peer
+    return request.headers.get("x-real-ip") or (request.client.host if request.client else "")
+
+
+def throttle_login(request: Request, email: str):
+    """Raise 429 with Retry-After when the caller's IP or the email is over its budget."""
+    if not LOGIN_RATE_LIMIT_ENABLED:
+        return
+
+    checks = (
+        ("ip", login_ip_limiter, client_ip(request)),
+        ("email", login_email_limiter, email.strip().lower()),
+    )
+
+    for scope, limiter, key in checks:
+        wait = limiter.acquire(key)
+
+        if wait:
+            LOGIN_THROTTLED.labels(scope).inc()
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, retry later",
+                headers={"Retry-After": str(math.ceil(min(wait, 86400)))},
+            )
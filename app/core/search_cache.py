@@ -0,0 +1,162 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.geo import GEO_INDEX_CELL_DEG, cell_of, covering_cells, distance_km
+from app.core.metrics import (
+    SEARCH_CACHE_ENTRIES,
+    SEARCH_CACHE_EVICTIONS,
+    SEARCH_CACHE_HITS,
+    SEARCH_CACHE_MISSES,
+)
+
+
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", 2048))
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", 60))
+SEARCH_CACHE_CELL_DEG = float(os.getenv("SEARCH_CACHE_CELL_DEG", 0.002))
+SEARCH_CACHE_RADIUS_STEP_KM = float(os.getenv("SEARCH_CACHE_RADIUS_STEP_KM", 0.5))
+SEARCH_CACHE_MAX_ROWS = int(os.getenv("SEARCH_CACHE_MAX_ROWS", 500))
+
+
+class SearchCache:
+    """
+    LRU + TTL cache of search matches keyed by quantized location.
+
+    Searches are keyed by a small grid cell and a radius rounded up to a
+    bucket, so nearby requests share an entry. An entry holds every
+    match within ``reach_km`` of the cell centre, a superset of what any
+    search from inside the cell can return; callers filter it against
+    their exact point and radius. Terms with too many matches to hold
+    are cached by count only. Each entry is also registered under
+    the coarse geo cells its circle covers, so a write at one location
+    only drops the entries that could contain it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        cell_deg: float,
+        radius_step_km: float,
+        invalidation_cell_deg: float,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cell_deg = cell_deg
+        self.radius_step_km = radius_step_km
+        self.invalidation_cell_deg = invalidation_cell_deg
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._by_cell = {}
+        self._uncelled = set()
+
+    def quantize(self, lat: float, lng: float, radius_km: float):
+        row, col = cell_of(lat, lng, self.cell_deg)
+        q_lat = (row + 0.5) * self.cell_deg - 90
+        q_lng = (col + 0.5) * self.cell_deg - 180
+        q_radius = math.ceil(radius_km / self.radius_step_km) * self.radius_step_km
+        return q_lat, q_lng, q_radius
+
+    def reach_km(self, q_lat: float, q_lng: float, q_radius_km: float) -> float:
+        """Radius around a cell centre that covers every search from inside the cell."""
+        half = self.cell_deg / 2
+        corner_km = max(
+            distance_km(q_lat, q_lng, q_lat + d_lat, q_lng + half)
+            for d_lat in (-half, half)
+        )
+        return q_radius_km + corner_km
+
+    def key(self, food: str, lat: float, lng: float, radius_km: float, *extra) -> tuple:
+        return (food.lower(), cell_of(lat, lng, self.cell_deg), radius_km) + extra
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                SEARCH_CACHE_MISSES.inc()
+                return None
+
+            if entry["expires_at"] <= time.monotonic():
+                self._drop(key, "ttl")
+                SEARCH_CACHE_MISSES.inc()
+                return None
+
+            self._entries.move_to_end(key)
+            SEARCH_CACHE_HITS.inc()
+            return entry["value"]
+
+    def put(self, key, value, lat: float, lng: float, radius_km: float):
+        cells = covering_cells(lat, lng, radius_km, self.invalidation_cell_deg)
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key, None)
+
+            self._entries[key] = {
+                "value": value,
+                "expires_at": time.monotonic() + self.ttl_seconds,
+                "center": (lat, lng, radius_km),
+                "cells": cells,
+            }
+
+            if cells is None:
+                self._uncelled.add(key)
+            else:
+                for cell in cells:
+                    self._by_cell.setdefault(cell, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest, "lru")
+
+            SEARCH_CACHE_ENTRIES.set(len(self._entries))
+
+    def invalidate_point(self, lat: float, lng: float):
+        """Drop entries whose search circle contains (lat, lng)."""
+        cell = cell_of(lat, lng, self.invalidation_cell_deg)
+
+        with self._lock:
+            keys = self._by_cell.get(cell, set()) | self._uncelled
+
+            for key in keys:
+                c_lat, c_lng, c_radius = self._entries[key]["center"]
+                if distance_km(c_lat, c_lng, lat, lng) <= c_radius:
+                    self._drop(key, "invalidation")
+
+            SEARCH_CACHE_ENTRIES.set(len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_cell.clear()
+            self._uncelled.clear()
+            SEARCH_CACHE_ENTRIES.set(0)
+
+    def _drop(self, key, reason):
+        entry = self._entries.pop(key)
+
+        if entry["cells"] is None:
+            self._uncelled.discard(key)
+        else:
+            for cell in entry["cells"]:
+                members = self._by_cell.get(cell)
+                if members is not None:
+                    members.discard(key)
+                    if not members:
+                        del self._by_cell[cell]
+
+        if reason is not None:
+            SEARCH_CACHE_EVICTIONS.labels(reason=reason).inc()
+
+
+search_cache = SearchCache(
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
+    SEARCH_CACHE_CELL_DEG,
+    SEARCH_CACHE_RADIUS_STEP_KM,
+    GEO_INDEX_CELL_DEG,
+)
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+import hashlib
 import os
 import secrets
 from dotenv import load_dotenv
@@ -6,9 +7,16 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.password_pool import password_pool
+from app.core.principal_cache import (
+    PRINCIPAL_CACHE_ENABLED,
+    PRINCIPAL_FRESH_COLUMNS,
+    principal_cache
+)
 from app.models.user import User
 
 
@@ -29,7 +37,19 @@ if not SECRET_KEY:
 # -------------------------
 # Password Hashing (Argon2)
 # -------------------------
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Cost per host from `python -m app.core.argon2_calibration`, library defaults otherwise.
+# Stored hashes with other parameters are rehashed on the next login.
+ARGON2_SETTINGS = {
+    f"argon2__{name}": int(os.getenv(env))
+    for name, env in (
+        ("time_cost", "ARGON2_TIME_COST"),
+        ("memory_cost", "ARGON2_MEMORY_COST"),
+        ("parallelism", "ARGON2_PARALLELISM"),
+    )
+    if os.getenv(env)
+}
+
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto", **ARGON2_SETTINGS)
 security = HTTPBearer()
 
 
@@ -44,6 +64,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Async routes hash on the bounded Argon2 pool instead of the threadpool
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run("hash", hash_password, password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str):
+    """
+    Returns (verified, new_hash). new_hash is set when the stored hash
+    uses outdated Argon2 parameters and should replace it.
+    """
+    return await password_pool.run(
+        "verify", pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 # -------------------------
 # Create Access Token (15 min)
 # -------------------------
@@ -61,6 +96,11 @@ def create_refresh_token() -> str:
     return secrets.token_urlsafe(64)
 
 
+def hash_refresh_token(token: str) -> str:
+    # Tokens are long and random, a plain digest is enough to look them up
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 # -------------------------
 # Get Current User From Token
 # -------------------------
@@ -80,12 +120,43 @@ def get_current_user(
                 detail="Invalid authentication credentials",
             )
 
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        user = principal_cache.get(int(user_id)) if PRINCIPAL_CACHE_ENABLED else None
+
+        if user is not None:
+            # Another worker may have revoked or deleted the user, read that fresh
+            fresh = db.execute(
+                select(*[getattr(User, key) for key in PRINCIPAL_FRESH_COLUMNS])
+                .where(User.id == user.id)
+            ).first()
+
+            if fresh is None:
+                principal_cache.invalidate(user.id)
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                )
+
+            for key, value in zip(PRINCIPAL_FRESH_COLUMNS, fresh):
+                setattr(user, key, value)
 
         if user is None:
+            epoch = principal_cache.epoch()
+            user = db.query(User).filter(User.id == int(user_id)).first()
+
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                )
+
+            if PRINCIPAL_CACHE_ENABLED:
+                principal_cache.put(user, epoch)
+
+        # Tokens from before the last "log out everywhere" are dead
+        if payload.get("gen", 0) != user.token_generation:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
+                detail="Token revoked",
             )
 
         return user
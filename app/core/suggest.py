@@ -0,0 +1,280 @@
+import bisect
+import heapq
+import os
+import threading
+import time
+
+from app.core.geo import cell_of
+
+
+SUGGEST_CELL_DEG = float(os.getenv("SUGGEST_CELL_DEG", 0.5))
+SUGGEST_REFRESH_SECONDS = int(os.getenv("SUGGEST_REFRESH_SECONDS", 300))
+SUGGEST_MAX_LIMIT = 50
+SUGGEST_MEMO_SIZE = 4096
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class _NameScope:
+    """
+    Distinct food names for one scope, as a sorted array of keys.
+
+    Every word start of a name is a key, so "biry" finds
+    "Chicken Biryani". Counts track how many items carry each name.
+    Ranked results are memoized per prefix until the next write, so
+    repeated keystrokes skip the range scan.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.counts = {}
+        self.display = {}
+        self._memo = {}
+
+    @classmethod
+    def build(cls, names) -> "_NameScope":
+        """Scope holding ``names`` (repeats count), sorted once instead of per insert."""
+        scope = cls()
+
+        for name in names:
+            name_key = _normalize(name)
+            if not name_key:
+                continue
+
+            if name_key not in scope.counts:
+                scope.counts[name_key] = 0
+                scope.display[name_key] = name.strip()
+            scope.counts[name_key] += 1
+
+        scope.entries = sorted(
+            (suffix, name_key)
+            for name_key in scope.counts
+            for suffix in cls._suffixes(name_key)
+        )
+
+        return scope
+
+    def add(self, name: str):
+        name_key = _normalize(name)
+        if not name_key:
+            return
+
+        self._memo.clear()
+
+        if name_key not in self.counts:
+            self.counts[name_key] = 0
+            self.display[name_key] = name.strip()
+            for suffix in self._suffixes(name_key):
+                bisect.insort(self.entries, (suffix, name_key))
+
+        self.counts[name_key] += 1
+
+    def discard(self, name: str):
+        name_key = _normalize(name)
+        if name_key not in self.counts:
+            return
+
+        self._memo.clear()
+        self.counts[name_key] -= 1
+        if self.counts[name_key] > 0:
+            return
+
+        del self.counts[name_key]
+        del self.display[name_key]
+        for suffix in self._suffixes(name_key):
+            i = bisect.bisect_left(self.entries, (suffix, name_key))
+            if i < len(self.entries) and self.entries[i] == (suffix, name_key):
+                del self.entries[i]
+
+    def top(self, prefix: str) -> list[str]:
+        """Best ``SUGGEST_MAX_LIMIT`` name keys for ``prefix``, by item count."""
+        ranked = self._memo.get(prefix)
+        if ranked is not None:
+            return ranked
+
+        found = set()
+        i = bisect.bisect_left(self.entries, (prefix,))
+
+        while i < len(self.entries) and self.entries[i][0].startswith(prefix):
+            found.add(self.entries[i][1])
+            i += 1
+
+        ranked = heapq.nsmallest(
+            SUGGEST_MAX_LIMIT,
+            found,
+            key=lambda name_key: (-self.counts[name_key], name_key)
+        )
+
+        if len(self._memo) >= SUGGEST_MEMO_SIZE:
+            self._memo.clear()
+        self._memo[prefix] = ranked
+
+        return ranked
+
+    @staticmethod
+    def _suffixes(name_key: str) -> list[str]:
+        words = name_key.split(" ")
+        return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class FoodNameIndex:
+    """
+    Prefix index over available food names, kept per process.
+
+    One scope covers every restaurant and one scope exists per coarse
+    geo cell. Menu item write paths call ``upsert_item``/``remove_item``;
+    restaurant moves and deletions call ``invalidate`` so the index is
+    rebuilt from the database on the next lookup.
+    """
+
+    def __init__(self, cell_deg: float, refresh_seconds: int):
+        self.cell_deg = cell_deg
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._items = {}
+        self._global = _NameScope()
+        self._cells = {}
+        self._loaded_at = None
+        self._ready = False
+        self._generation = 0
+        self._replay = None
+
+    def ensure_loaded(self, db):
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.refresh_seconds:
+            return
+
+        # One rebuild at a time; once an index exists, others keep serving it
+        if not self._load_lock.acquire(blocking=not self._ready):
+            return
+
+        try:
+            loaded_at = self._loaded_at
+            if loaded_at is not None and time.monotonic() - loaded_at < self.refresh_seconds:
+                return
+
+            with self._lock:
+                generation = self._generation
+                self._replay = []
+
+            items, global_scope, cells = self._build(db)
+
+            with self._lock:
+                self._items = items
+                self._global = global_scope
+                self._cells = cells
+
+                # Writes that raced the load are applied on top of it
+                for args in self._replay:
+                    self._remove(args[0])
+                    if args[1] is not None:
+                        self._add(*args)
+                self._replay = None
+
+                self._ready = True
+                if generation == self._generation:
+                    self._loaded_at = time.monotonic()
+        finally:
+            self._load_lock.release()
+
+    def _build(self, db):
+        """Fresh items and scopes from the database, built without holding ``_lock``."""
+        from app.models.menu_item import FoodItem
+        from app.models.restaurant import Restaurant
+
+        rows = (
+            db.query(FoodItem.id, FoodItem.name, Restaurant.latitude, Restaurant.longitude)
+            .join(Restaurant, Restaurant.id == FoodItem.restaurant_id)
+            .filter(
+                FoodItem.is_available == True,
+                Restaurant.is_active == True
+            )
+            .all()
+        )
+
+        items = {}
+        names_by_cell = {}
+        for item_id, name, lat, lng in rows:
+            cell = cell_of(lat, lng, self.cell_deg)
+            items[item_id] = (name, cell)
+            names_by_cell.setdefault(cell, []).append(name)
+
+        global_scope = _NameScope.build(name for name, _ in items.values())
+        cells = {cell: _NameScope.build(names) for cell, names in names_by_cell.items()}
+
+        return items, global_scope, cells
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def upsert_item(self, item_id: int, name: str, lat: float, lng: float, visible: bool = True):
+        cell = cell_of(lat, lng, self.cell_deg)
+
+        with self._lock:
+            self._remove(item_id)
+            if visible:
+                self._add(item_id, name, cell)
+            if self._replay is not None:
+                self._replay.append((item_id, name, cell) if visible else (item_id, None, None))
+
+    def remove_item(self, item_id: int):
+        with self._lock:
+            self._remove(item_id)
+            if self._replay is not None:
+                self._replay.append((item_id, None, None))
+
+    def suggest(self, prefix: str, k: int, lat: float = None, lng: float = None) -> list[str]:
+        """Top ``k`` distinct names with a word starting with ``prefix``."""
+        prefix = _normalize(prefix)
+        if not prefix:
+            return []
+
+        with self._lock:
+            if lat is None or lng is None:
+                scopes = [self._global]
+            else:
+                columns = round(360 / self.cell_deg)
+                row, col = cell_of(lat, lng, self.cell_deg)
+                neighbours = {
+                    (row + d_row, (col + d_col) % columns)
+                    for d_row in (-1, 0, 1)
+                    for d_col in (-1, 0, 1)
+                }
+                scopes = [self._cells[cell] for cell in neighbours if cell in self._cells]
+
+            counts = {}
+            display = {}
+            for scope in scopes:
+                for name_key in scope.top(prefix):
+                    counts[name_key] = counts.get(name_key, 0) + scope.counts[name_key]
+                    display[name_key] = scope.display[name_key]
+
+        top = heapq.nsmallest(k, counts, key=lambda name_key: (-counts[name_key], name_key))
+        return [display[name_key] for name_key in top]
+
+    def _add(self, item_id: int, name: str, cell: tuple):
+        self._items[item_id] = (name, cell)
+        self._global.add(name)
+        self._cells.setdefault(cell, _NameScope()).add(name)
+
+    def _remove(self, item_id: int):
+        entry = self._items.pop(item_id, None)
+        if entry is None:
+            return
+
+        name, cell = entry
+        self._global.discard(name)
+
+        scope = self._cells.get(cell)
+        if scope is not None:
+            scope.discard(name)
+            if not scope.counts:
+                del self._cells[cell]
+
+
+food_name_index = FoodNameIndex(SUGGEST_CELL_DEG, SUGGEST_REFRESH_SECONDS)
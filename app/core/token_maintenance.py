@@ -0,0 +1,94 @@
+"""
+Purge expired and revoked refresh tokens.
+
+Deletes in small batches, each in its own transaction, so row locks are
+held briefly and replicas keep up. Meant to run on a schedule (cron, a
+Kubernetes CronJob, ...):
+
+    python -m app.core.token_maintenance --batch-size 1000
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, or_, select, text
+
+from app.core.database import SessionLocal, engine
+from app.models.refresh_token import RefreshToken
+
+
+TOKEN_PURGE_BATCH_SIZE = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", 1000))
+TOKEN_PURGE_PAUSE_SECONDS = float(os.getenv("TOKEN_PURGE_PAUSE_SECONDS", 0.05))
+
+
+def purge_refresh_tokens(
+    batch_size: int = TOKEN_PURGE_BATCH_SIZE,
+    pause_seconds: float = TOKEN_PURGE_PAUSE_SECONDS,
+    max_batches: int = None,
+) -> int:
+    """Delete expired or revoked tokens, returns the number of rows removed."""
+    reclaimed = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        batch = (
+            select(RefreshToken.id)
+            .where(
+                or_(
+                    RefreshToken.expires_at < datetime.utcnow(),
+                    RefreshToken.is_revoked == True
+                )
+            )
+            .limit(batch_size)
+            # Rows a concurrent refresh is rotating are left for the next run
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+
+        with SessionLocal() as db:
+            deleted = db.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+
+        reclaimed += deleted
+        batches += 1
+
+        if deleted < batch_size:
+            break
+
+        time.sleep(pause_seconds)
+
+    return reclaimed
+
+
+def vacuum_refresh_tokens():
+    """Hand the freed pages back to the table and refresh planner stats."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM (ANALYZE) refresh_tokens"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=TOKEN_PURGE_BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=TOKEN_PURGE_PAUSE_SECONDS,
+                        help="seconds to sleep between batches")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--vacuum", action="store_true",
+                        help="run VACUUM (ANALYZE) on refresh_tokens afterwards")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    reclaimed = purge_refresh_tokens(args.batch_size, args.pause, args.max_batches)
+    print(f"refresh_tokens: reclaimed {reclaimed} rows in {time.perf_counter() - start:.1f}s")
+
+    if args.vacuum:
+        vacuum_refresh_tokens()
+        print("refresh_tokens: vacuumed")
+
+
+if __name__ == "__main__":
+    main()
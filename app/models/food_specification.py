@@ -11,7 +11,10 @@ class FoodSpecification(Base):
     label = Column(String, nullable=False)
     value = Column(String, nullable=False)
 
-    food_item_id = Column(Integer, ForeignKey("food_items.id"), nullable=False)
+    # Order within the item, as the client last sent it
+    position = Column(Integer, nullable=False, default=0, server_default="0")
+
+    food_item_id = Column(Integer, ForeignKey("food_items.id"), nullable=False, index=True)
 
     # Relationship back to FoodItem
     food_item = relationship("FoodItem", back_populates="specifications")
\ No newline at end of file
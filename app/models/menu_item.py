@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.base import Base
@@ -6,6 +6,15 @@ from app.models.base import Base
 
 class FoodItem(Base):
     __tablename__ = "food_items"
+    __table_args__ = (
+        # Trigram index so ILIKE '%term%' name matching avoids a full scan
+        Index(
+            "ix_food_items_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -16,7 +25,7 @@ class FoodItem(Base):
     is_available = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False, index=True)
 
     # Relationship to Restaurant
     restaurant = relationship("Restaurant", back_populates="menu_items")
@@ -25,12 +34,14 @@ class FoodItem(Base):
     variants = relationship(
         "FoodVariant",
         back_populates="food_item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="(FoodVariant.position, FoodVariant.id)"
     )
 
     # Relationship to FoodSpecification
     specifications = relationship(
         "FoodSpecification",
         back_populates="food_item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="(FoodSpecification.position, FoodSpecification.id)"
     )
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -7,13 +7,22 @@ from app.models.base import Base
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Revoked rows only, so the purge finds them without a full scan
+        Index(
+            "ix_refresh_tokens_revoked",
+            "id",
+            postgresql_where=text("is_revoked")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String, nullable=False)  # we will store hashed token later
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)  # sha256 hex of the token
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    generation = Column(Integer, nullable=False, default=0, server_default="0")  # users.token_generation at issue
 
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
     is_revoked = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    user = relationship("User", backref="refresh_tokens")
\ No newline at end of file
+    user = relationship("User", backref="refresh_tokens")
@@ -11,4 +11,6 @@ class User(Base):
     phone = Column(String, nullable=False)
     password_hash = Column(String, nullable=False)
     role = Column(String, default="owner")
+    # Bumped to revoke every access and refresh token issued so far
+    token_generation = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
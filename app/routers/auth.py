@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from app.core.database import get_db
+from app.core.principal_cache import principal_cache
+from app.core.rate_limit import throttle_login
 from app.models.user import User
 from app.models.refresh_token import RefreshToken
 from app.schemas.user import (
@@ -12,10 +15,12 @@ from app.schemas.user import (
     RefreshRequest,
 )
 from app.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
     create_access_token,
     create_refresh_token,
+    hash_refresh_token,
+    get_current_user,
     REFRESH_TOKEN_EXPIRE_DAYS,
 )
 
@@ -24,19 +29,25 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 
 # 🔹 Register
 @router.post("/register", response_model=TokenResponse)
-def register(user: UserRegister, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user.email).first()
+async def register(user: UserRegister, db: Session = Depends(get_db)):
+    existing_user = await run_in_threadpool(_user_by_email, db, user.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
+    password_hash = await hash_password_async(user.password)
+
+    return await run_in_threadpool(_create_user, db, user, password_hash)
+
+
+def _create_user(db: Session, user: UserRegister, password_hash: str) -> dict:
     new_user = User(
         name=user.name,
         email=user.email,
         phone=user.phone,
-        password_hash=hash_password(user.password),
+        password_hash=password_hash,
         role="owner",
     )
 
@@ -44,43 +55,48 @@ def register(user: UserRegister, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(new_user)
 
-    access_token = create_access_token({"sub": str(new_user.id)})
-    refresh_token_value = create_refresh_token()
-
-    refresh_token = RefreshToken(
-        token=refresh_token_value,
-        user_id=new_user.id,
-        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
-        is_revoked=False,
-    )
-
-    db.add(refresh_token)
-    db.commit()
-
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token_value,
-        "token_type": "bearer",
-    }
+    return _issue_tokens(db, new_user)
 
 
 # 🔹 Login
 @router.post("/login", response_model=TokenResponse)
-def login(user: UserLogin, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def login(user: UserLogin, request: Request, db: Session = Depends(get_db)):
+    # Turn bursts away before they cost an Argon2 verification
+    throttle_login(request, user.email)
+
+    db_user = await run_in_threadpool(_user_by_email, db, user.email)
 
-    if not db_user or not verify_password(user.password, db_user.password_hash):
+    verified, new_hash = False, None
+    if db_user:
+        verified, new_hash = await verify_and_update_password_async(
+            user.password, db_user.password_hash
+        )
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
-    access_token = create_access_token({"sub": str(db_user.id)})
+    # Upgrade hashes made with older Argon2 parameters, committed with the new tokens
+    if new_hash:
+        db_user.password_hash = new_hash
+
+    return await run_in_threadpool(_issue_tokens, db, db_user)
+
+
+def _user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _issue_tokens(db: Session, user: User) -> dict:
+    access_token = create_access_token({"sub": str(user.id), "gen": user.token_generation})
     refresh_token_value = create_refresh_token()
 
     refresh_token = RefreshToken(
-        token=refresh_token_value,
-        user_id=db_user.id,
+        token_hash=hash_refresh_token(refresh_token_value),
+        user_id=user.id,
+        generation=user.token_generation,
         expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
         is_revoked=False,
     )
@@ -101,7 +117,7 @@ def refresh(request: RefreshRequest, db: Session = Depends(get_db)):
 
     db_token = (
         db.query(RefreshToken)
-        .filter(RefreshToken.token == request.refresh_token)
+        .filter(RefreshToken.token_hash == hash_refresh_token(request.refresh_token))
         .first()
     )
 
@@ -130,29 +146,16 @@ def refresh(request: RefreshRequest, db: Session = Depends(get_db)):
             detail="User not found",
         )
 
-    # Revoke old token
-    db_token.is_revoked = True
-
-    # Create new refresh token
-    new_refresh_token_value = create_refresh_token()
-
-    new_refresh_token = RefreshToken(
-        token=new_refresh_token_value,
-        user_id=user.id,
-        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
-        is_revoked=False,
-    )
-
-    db.add(new_refresh_token)
-    db.commit()
+    if db_token.generation != user.token_generation:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token revoked",
+        )
 
-    new_access_token = create_access_token({"sub": str(user.id)})
+    # Revoke old token, committed with the new one
+    db_token.is_revoked = True
 
-    return {
-        "access_token": new_access_token,
-        "refresh_token": new_refresh_token_value,
-        "token_type": "bearer",
-    }
+    return _issue_tokens(db, user)
 
 
 # 🔹 Logout
@@ -161,7 +164,7 @@ def logout(request: RefreshRequest, db: Session = Depends(get_db)):
 
     db_token = (
         db.query(RefreshToken)
-        .filter(RefreshToken.token == request.refresh_token)
+        .filter(RefreshToken.token_hash == hash_refresh_token(request.refresh_token))
         .first()
     )
 
@@ -174,4 +177,23 @@ def logout(request: RefreshRequest, db: Session = Depends(get_db)):
     db_token.is_revoked = True
     db.commit()
 
-    return {"message": "Logged out successfully"}
\ No newline at end of file
+    return {"message": "Logged out successfully"}
+
+
+# 🔹 Logout Everywhere
+@router.post("/logout-all")
+def logout_all(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+
+    # One row write: every token carrying the old generation stops working
+    db.query(User).filter(User.id == current_user.id).update(
+        {User.token_generation: User.token_generation + 1},
+        synchronize_session=False,
+    )
+    db.commit()
+
+    principal_cache.invalidate(current_user.id)
+
+    return {"message": "Logged out from all sessions"}
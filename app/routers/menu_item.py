@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db, read_row, read_rows, row_columns, run_db
+from app.core.fast_json import FAST_JSON_ENABLED, FastJSONResponse, menu_item_payload
+from app.core.menu_cache import menu_cache
+from app.core.search_cache import search_cache
 from app.core.security import get_current_user
+from app.core.suggest import food_name_index
 
 from app.models.restaurant import Restaurant
 from app.models.menu_item import FoodItem
@@ -58,21 +63,23 @@ def create_food_item(
     db.flush()
 
     # add variants
-    for variant in menu_item.variants:
+    for position, variant in enumerate(menu_item.variants):
         db.add(
             FoodVariant(
                 name=variant.name,
                 price=variant.price,
+                position=position,
                 food_item_id=new_item.id
             )
         )
 
     # add specifications
-    for spec in menu_item.specifications:
+    for position, spec in enumerate(menu_item.specifications):
         db.add(
             FoodSpecification(
                 label=spec.label,
                 value=spec.value,
+                position=position,
                 food_item_id=new_item.id
             )
         )
@@ -80,6 +87,16 @@ def create_food_item(
     db.commit()
     db.refresh(new_item)
 
+    menu_cache.bump(restaurant.id)
+    search_cache.invalidate_point(restaurant.latitude, restaurant.longitude)
+    food_name_index.upsert_item(
+        new_item.id,
+        new_item.name,
+        restaurant.latitude,
+        restaurant.longitude,
+        new_item.is_available and restaurant.is_active
+    )
+
     return new_item
 
 
@@ -87,25 +104,44 @@ def create_food_item(
 # Get Food Item
 # -------------------------
 @router.get("/{menu_item_id}", response_model=MenuItemResponse)
-def get_food_item(
+async def get_food_item(
     menu_item_id: int,
-    db: Session = Depends(get_db)
+    db = Depends(get_async_db)
 ):
 
-    food_item = (
-        db.query(FoodItem)
-        .options(
-            joinedload(FoodItem.variants),
-            joinedload(FoodItem.specifications)
-        )
-        .filter(FoodItem.id == menu_item_id)
-        .first()
+    food_item = await run_db(db, _load_food_item, menu_item_id)
+
+    if FAST_JSON_ENABLED:
+        return FastJSONResponse(food_item)
+
+    return food_item
+
+
+def _load_food_item(db: Session, menu_item_id: int) -> dict:
+
+    item = read_row(
+        db,
+        select(*row_columns(FoodItem)).where(FoodItem.id == menu_item_id)
     )
 
-    if not food_item:
+    if not item:
         raise HTTPException(status_code=404, detail="Food item not found")
 
-    return food_item
+    variants = read_rows(
+        db,
+        select(*row_columns(FoodVariant))
+        .where(FoodVariant.food_item_id == menu_item_id)
+        .order_by(FoodVariant.position, FoodVariant.id)
+    )
+
+    specifications = read_rows(
+        db,
+        select(*row_columns(FoodSpecification))
+        .where(FoodSpecification.food_item_id == menu_item_id)
+        .order_by(FoodSpecification.position, FoodSpecification.id)
+    )
+
+    return menu_item_payload(item, variants, specifications)
 
 
 # -------------------------
@@ -122,6 +158,11 @@ def update_food_item(
     food_item = (
         db.query(FoodItem)
         .join(Restaurant)
+        .options(
+            contains_eager(FoodItem.restaurant),
+            selectinload(FoodItem.variants),
+            selectinload(FoodItem.specifications)
+        )
         .filter(
             FoodItem.id == menu_item_id,
             Restaurant.owner_id == current_user.id
@@ -153,48 +194,38 @@ def update_food_item(
     # -------------------------
     if menu_item_data.variants is not None:
 
-        db.query(FoodVariant).filter(
-            FoodVariant.food_item_id == menu_item_id
-        ).delete()
-
-        for variant in menu_item_data.variants:
-            db.add(
-                FoodVariant(
-                    name=variant.name,
-                    price=variant.price,
-                    food_item_id=menu_item_id
-                )
-            )
+        _sync_children(
+            food_item.variants,
+            [(variant.name, variant.price) for variant in menu_item_data.variants],
+            ("name", "price"),
+            FoodVariant
+        )
 
     # -------------------------
     # Update specifications
     # -------------------------
     if menu_item_data.specifications is not None:
 
-        db.query(FoodSpecification).filter(
-            FoodSpecification.food_item_id == menu_item_id
-        ).delete()
-
-        for spec in menu_item_data.specifications:
-            db.add(
-                FoodSpecification(
-                    label=spec.label,
-                    value=spec.value,
-                    food_item_id=menu_item_id
-                )
-            )
+        _sync_children(
+            food_item.specifications,
+            [(spec.label, spec.value) for spec in menu_item_data.specifications],
+            ("label", "value"),
+            FoodSpecification
+        )
+
+    # Flush batches the child changes, the response comes from session state
+    db.flush()
+    updated_item = MenuItemResponse.model_validate(food_item)
+
+    restaurant = food_item.restaurant
+    position = (restaurant.latitude, restaurant.longitude)
+    visible = food_item.is_available and restaurant.is_active
 
     db.commit()
 
-    updated_item = (
-        db.query(FoodItem)
-        .options(
-            joinedload(FoodItem.variants),
-            joinedload(FoodItem.specifications)
-        )
-        .filter(FoodItem.id == menu_item_id)
-        .first()
-    )
+    menu_cache.bump(restaurant.id)
+    search_cache.invalidate_point(*position)
+    food_name_index.upsert_item(menu_item_id, updated_item.name, *position, visible)
 
     return updated_item
 
@@ -212,6 +243,7 @@ def delete_food_item(
     food_item = (
         db.query(FoodItem)
         .join(Restaurant)
+        .options(contains_eager(FoodItem.restaurant))
         .filter(
             FoodItem.id == menu_item_id,
             Restaurant.owner_id == current_user.id
@@ -225,7 +257,72 @@ def delete_food_item(
             detail="Not authorized to delete this food item"
         )
 
+    restaurant_id = food_item.restaurant_id
+    position = (food_item.restaurant.latitude, food_item.restaurant.longitude)
+
     db.delete(food_item)
     db.commit()
 
-    return {"message": "Food item deleted successfully"}
\ No newline at end of file
+    menu_cache.bump(restaurant_id)
+    search_cache.invalidate_point(*position)
+    food_name_index.remove_item(menu_item_id)
+
+    return {"message": "Food item deleted successfully"}
+
+
+def _sync_children(children: list, wanted: list[tuple], fields: tuple, model):
+    """
+    Reconcile a child collection with the requested rows, in order.
+
+    Rows that already match are left alone, rows sharing the first field
+    (name or label) are updated in place, leftovers are reused before
+    anything is inserted, and only the surplus is deleted. Each row's
+    ``position`` is set to its index in ``wanted``, so a pure reorder
+    becomes position updates. The session batches the resulting
+    INSERT/UPDATE/DELETE statements at flush.
+    """
+    unmatched = list(children)
+    assigned = [None] * len(wanted)
+
+    # Unchanged rows, including pure reorders
+    for index, values in enumerate(wanted):
+        child = next(
+            (c for c in unmatched if tuple(getattr(c, f) for f in fields) == values),
+            None
+        )
+        if child is not None:
+            unmatched.remove(child)
+            assigned[index] = child
+
+    # Same key, different details
+    for index, values in enumerate(wanted):
+        if assigned[index] is not None:
+            continue
+
+        child = next((c for c in unmatched if getattr(c, fields[0]) == values[0]), None)
+        if child is not None:
+            unmatched.remove(child)
+            assigned[index] = child
+
+    # Reuse remaining rows before inserting or deleting
+    for index, values in enumerate(wanted):
+        if assigned[index] is not None:
+            continue
+
+        if unmatched:
+            assigned[index] = unmatched.pop(0)
+        else:
+            assigned[index] = model()
+            children.append(assigned[index])
+
+    for child in unmatched:
+        children.remove(child)
+
+    # Unchanged values are not written at flush
+    for position, (child, values) in enumerate(zip(assigned, wanted)):
+        for field, value in zip(fields, values):
+            setattr(child, field, value)
+        child.position = position
+
+    # The response is built from this collection, keep it in the stored order
+    children.sort(key=lambda child: child.position)
@@ -1,11 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.database import get_db
+import csv
+import io
+import json
+import os
+
+from itertools import islice
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import (
+    NDJSON_MEDIA_TYPE,
+    get_async_db,
+    get_db,
+    read_row,
+    read_rows,
+    row_columns,
+    run_db,
+    stream_rows
+)
+from app.core.fast_json import FAST_JSON_ENABLED, dumps, restaurant_menu_payload
+from app.core.geo import restaurant_index
+from app.core.menu_cache import etag_matches, menu_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.search_cache import search_cache
+from app.core.suggest import food_name_index
 from app.core.security import get_current_user
 
 from app.models.restaurant import Restaurant
 from app.models.menu_item import FoodItem
+from app.models.food_variant import FoodVariant
+from app.models.food_specification import FoodSpecification
 from app.models.user import User
 
 from app.schemas.restaurant import (
@@ -14,6 +43,7 @@ from app.schemas.restaurant import (
     RestaurantUpdate
 )
 from app.schemas.restaurant_menu import RestaurantMenuResponse
+from app.schemas.menu_item import MenuAvailabilityUpdate, MenuItemImport
 
 
 router = APIRouter(
@@ -21,6 +51,12 @@ router = APIRouter(
     tags=["Restaurants"]
 )
 
+MENU_IMPORT_MAX_ROWS = int(os.getenv("MENU_IMPORT_MAX_ROWS", 10000))
+MENU_IMPORT_MAX_BYTES = int(os.getenv("MENU_IMPORT_MAX_BYTES", 5 * 1024 * 1024))
+RESTAURANTS_DEFAULT_LIMIT = 100
+RESTAURANTS_MAX_LIMIT = 500
+RESTAURANTS_STREAM_CHUNK_SIZE = int(os.getenv("RESTAURANTS_STREAM_CHUNK_SIZE", 500))
+
 
 # -------------------------
 # Create Restaurant (Owner Protected)
@@ -51,6 +87,14 @@ def create_restaurant(
     db.commit()
     db.refresh(new_restaurant)
 
+    restaurant_index.upsert(
+        new_restaurant.id,
+        new_restaurant.latitude,
+        new_restaurant.longitude,
+        new_restaurant.is_active
+    )
+    search_cache.invalidate_point(new_restaurant.latitude, new_restaurant.longitude)
+
     return new_restaurant
 
 
@@ -58,21 +102,62 @@ def create_restaurant(
 # Get My Restaurants
 # -------------------------
 @router.get("/me", response_model=list[RestaurantResponse])
-def get_my_restaurants(
-    db: Session = Depends(get_db),
+async def get_my_restaurants(
+    request: Request,
+    response: Response,
+    limit: int = Query(RESTAURANTS_DEFAULT_LIMIT, ge=1, le=RESTAURANTS_MAX_LIMIT),
+    cursor: Optional[str] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    owner_id: Optional[int] = Query(None),
+    db = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
+    """
+    List restaurants, all of them for admins and their own for owners.
 
-    if current_user.role == "admin":
-        return db.query(Restaurant).all()
+    Admins get pages of ``limit`` rows with the next cursor in the
+    X-Next-Cursor header. Owners keep the full unpaginated list, so
+    ``limit`` and ``cursor`` only apply to admins. Either can filter, and
+    an Accept of application/x-ndjson streams every match.
+    """
+    statement = select(*row_columns(Restaurant)).order_by(Restaurant.id)
 
-    restaurants = (
-        db.query(Restaurant)
-        .filter(Restaurant.owner_id == current_user.id)
-        .all()
-    )
+    is_admin = current_user.role == "admin"
+
+    # Owners only ever see their own restaurants
+    if not is_admin:
+        statement = statement.where(Restaurant.owner_id == current_user.id)
+
+    if owner_id is not None:
+        statement = statement.where(Restaurant.owner_id == owner_id)
+
+    if is_active is not None:
+        statement = statement.where(Restaurant.is_active == is_active)
+
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            stream_rows(db, statement, _restaurant_ndjson_line, RESTAURANTS_STREAM_CHUNK_SIZE),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+
+    if not is_admin:
+        return await run_db(db, read_rows, statement)
+
+    if cursor is not None:
+        after_id, = decode_cursor(cursor, int)
+        statement = statement.where(Restaurant.id > after_id)
+
+    rows = await run_db(db, read_rows, statement.limit(limit + 1))
 
-    return restaurants
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].id)
+
+    return rows
+
+
+def _restaurant_ndjson_line(row) -> str:
+    return RestaurantResponse.model_validate(row).model_dump_json() + "\n"
 
 
 # -------------------------
@@ -104,6 +189,8 @@ def update_restaurant(
             detail="Not authorized to update this restaurant"
         )
 
+    old_position = (restaurant.latitude, restaurant.longitude)
+
     update_data = restaurant_data.model_dump(exclude_unset=True)
 
     for key, value in update_data.items():
@@ -112,9 +199,91 @@ def update_restaurant(
     db.commit()
     db.refresh(restaurant)
 
+    restaurant_index.upsert(
+        restaurant.id,
+        restaurant.latitude,
+        restaurant.longitude,
+        restaurant.is_active
+    )
+    search_cache.invalidate_point(*old_position)
+    search_cache.invalidate_point(restaurant.latitude, restaurant.longitude)
+
+    menu_cache.bump(restaurant.id)
+
+    # Moves and (de)activation change which items suggestions may show
+    if {"latitude", "longitude", "is_active"} & update_data.keys():
+        food_name_index.invalidate()
+
     return restaurant
 
 
+# -------------------------
+# Bulk Availability Toggle (Owner Protected)
+# -------------------------
+@router.patch("/{restaurant_id}/availability")
+def update_menu_availability(
+    restaurant_id: int,
+    availability: MenuAvailabilityUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+
+    restaurant = read_row(
+        db,
+        select(*row_columns(Restaurant, "id", "owner_id", "latitude", "longitude", "is_active"))
+        .where(Restaurant.id == restaurant_id)
+    )
+
+    if not restaurant:
+        raise HTTPException(
+            status_code=404,
+            detail="Restaurant not found"
+        )
+
+    if current_user.role != "admin" and restaurant.owner_id != current_user.id:
+        raise HTTPException(
+            status_code=403,
+            detail="Not authorized to update this restaurant"
+        )
+
+    # One UPDATE for every item, ids from other restaurants are left alone
+    updated = db.execute(
+        update(FoodItem)
+        .where(
+            FoodItem.restaurant_id == restaurant_id,
+            FoodItem.id.in_(availability.items.keys())
+        )
+        .values(is_available=case(availability.items, value=FoodItem.id))
+        .returning(FoodItem.id, FoodItem.name, FoodItem.is_available)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    db.commit()
+
+    menu_cache.bump(restaurant_id)
+    search_cache.invalidate_point(restaurant.latitude, restaurant.longitude)
+
+    for item in updated:
+        food_name_index.upsert_item(
+            item.id,
+            item.name,
+            restaurant.latitude,
+            restaurant.longitude,
+            item.is_available and restaurant.is_active
+        )
+
+    found = {item.id for item in updated}
+
+    return {
+        "restaurant_id": restaurant_id,
+        "updated": [
+            {"id": item.id, "is_available": item.is_available}
+            for item in updated
+        ],
+        "not_found": [item_id for item_id in availability.items if item_id not in found]
+    }
+
+
 # -------------------------
 # Delete Restaurant
 # -------------------------
@@ -143,9 +312,16 @@ def delete_restaurant(
             detail="Not authorized to delete this restaurant"
         )
 
+    position = (restaurant.latitude, restaurant.longitude)
+
     db.delete(restaurant)
     db.commit()
 
+    restaurant_index.remove(restaurant_id)
+    search_cache.invalidate_point(*position)
+    food_name_index.invalidate()
+    menu_cache.bump(restaurant_id)
+
     return {
         "message": "Restaurant deleted successfully",
         "restaurant_id": restaurant_id
@@ -156,39 +332,309 @@ def delete_restaurant(
 # Get Restaurant Menu (Public)
 # -------------------------
 @router.get("/{restaurant_id}/menu", response_model=RestaurantMenuResponse)
-def get_restaurant_menu(
+async def get_restaurant_menu(
     restaurant_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db = Depends(get_async_db)
 ):
 
+    # Serve the cached snapshot, or rebuild it for the current version
+    snapshot = menu_cache.get(restaurant_id)
+
+    if snapshot is None:
+        version = menu_cache.version(restaurant_id)
+        body = await run_db(db, _render_restaurant_menu, restaurant_id)
+        snapshot = menu_cache.put(restaurant_id, version, body)
+
+    body, etag = snapshot
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _render_restaurant_menu(db: Session, restaurant_id: int) -> bytes:
+    menu = _load_restaurant_menu(db, restaurant_id)
+
+    if FAST_JSON_ENABLED:
+        return dumps(menu)
+
+    return RestaurantMenuResponse.model_validate(menu).model_dump_json().encode()
+
+
+def _load_restaurant_menu(db: Session, restaurant_id: int) -> dict:
+
+    restaurant = read_row(
+        db,
+        select(*row_columns(Restaurant, "id", "name", "phone", "latitude", "longitude"))
+        .where(Restaurant.id == restaurant_id)
+    )
+
+    if not restaurant:
+        raise HTTPException(
+            status_code=404,
+            detail="Restaurant not found"
+        )
+
+    # One query per collection, so rows don't multiply as items x variants x specs
+    available = (
+        FoodItem.restaurant_id == restaurant_id,
+        FoodItem.is_available == True
+    )
+
+    items = read_rows(
+        db,
+        select(*row_columns(FoodItem))
+        .where(*available)
+        .order_by(FoodItem.id)
+    )
+
+    variants = read_rows(
+        db,
+        select(*row_columns(FoodVariant))
+        .join(FoodItem, FoodItem.id == FoodVariant.food_item_id)
+        .where(*available)
+        .order_by(FoodVariant.position, FoodVariant.id)
+    )
+
+    specifications = read_rows(
+        db,
+        select(*row_columns(FoodSpecification))
+        .join(FoodItem, FoodItem.id == FoodSpecification.food_item_id)
+        .where(*available)
+        .order_by(FoodSpecification.position, FoodSpecification.id)
+    )
+
+    return restaurant_menu_payload(restaurant, items, variants, specifications)
+
+
+# -------------------------
+# Bulk Import Menu Items (Owner Protected)
+# -------------------------
+@router.post("/{restaurant_id}/menu/import", status_code=status.HTTP_201_CREATED)
+async def import_menu_items(
+    restaurant_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Import many menu items in one transaction.
+
+    Accepts a JSON array of items (MenuItemImport) or, with
+    Content-Type text/csv, rows with the columns name, description,
+    rating, is_available, variants and specifications. In CSV, variants
+    are written as "Small:120|Large:200" and specifications as
+    "Spice:Hot|Serves:2". Nothing is inserted unless every row is valid.
+    Bodies over MENU_IMPORT_MAX_BYTES get 413, and more than
+    MENU_IMPORT_MAX_ROWS rows are rejected before any row is validated.
+    """
+    # Reject strangers before reading or parsing anything they sent
+    restaurant = await run_in_threadpool(_get_import_restaurant, db, current_user, restaurant_id)
+
+    body = await _read_import_body(request)
+
+    if "text/csv" in request.headers.get("content-type", ""):
+        rows, errors = _parse_csv_rows(body)
+    else:
+        rows, errors = _parse_json_rows(body)
+
+    if len(rows) > MENU_IMPORT_MAX_ROWS:
+        _reject_import([{
+            "row": None,
+            "errors": [{"loc": [], "msg": f"At most {MENU_IMPORT_MAX_ROWS} items per import"}]
+        }])
+
+    items = []
+    for index, row in enumerate(rows, start=1):
+        if row is None:
+            continue
+
+        try:
+            items.append(MenuItemImport.model_validate(row))
+        except ValidationError as e:
+            errors.append({
+                "row": index,
+                "errors": [
+                    {"loc": list(err["loc"]), "msg": err["msg"]}
+                    for err in e.errors()
+                ]
+            })
+
+    if errors:
+        _reject_import(errors)
+
+    return await run_in_threadpool(
+        _insert_menu_items, db, restaurant, items
+    )
+
+
+def _get_import_restaurant(db: Session, current_user: User, restaurant_id: int):
+
     restaurant = (
         db.query(Restaurant)
-        .options(
-            joinedload(Restaurant.menu_items)
-            .joinedload(FoodItem.variants),
-            joinedload(Restaurant.menu_items)
-            .joinedload(FoodItem.specifications)
+        .filter(
+            Restaurant.id == restaurant_id,
+            Restaurant.owner_id == current_user.id
         )
-        .filter(Restaurant.id == restaurant_id)
         .first()
     )
 
     if not restaurant:
         raise HTTPException(
-            status_code=404,
-            detail="Restaurant not found"
+            status_code=403,
+            detail="Not authorized to add menu to this restaurant"
         )
 
-    available_items = [
-        item for item in restaurant.menu_items
-        if item.is_available
+    return restaurant
+
+
+async def _read_import_body(request: Request) -> bytes:
+    too_large = HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Import body is limited to {MENU_IMPORT_MAX_BYTES} bytes"
+    )
+
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MENU_IMPORT_MAX_BYTES:
+        raise too_large
+
+    # Content-Length can be missing (chunked uploads), so count as we read
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MENU_IMPORT_MAX_BYTES:
+            raise too_large
+
+    return bytes(body)
+
+
+def _reject_import(errors: list):
+    raise HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        detail={
+            "message": "Import rejected, no items were created",
+            "errors": sorted(errors, key=lambda e: e["row"] or 0)
+        }
+    )
+
+
+def _parse_json_rows(body: bytes):
+    try:
+        rows = json.loads(body)
+    except ValueError:
+        rows = None
+
+    if not isinstance(rows, list):
+        return [], [{"row": None, "errors": [{"loc": [], "msg": "Expected a JSON array of items"}]}]
+
+    return rows, []
+
+
+def _parse_csv_rows(body: bytes):
+    rows = []
+    errors = []
+
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        return [], [{"row": None, "errors": [{"loc": [], "msg": f"CSV must be UTF-8 encoded ({e.reason} at byte {e.start})"}]}]
+
+    reader = csv.DictReader(io.StringIO(text))
+
+    # One row past the cap is enough to reject the import
+    for index, record in enumerate(islice(reader, MENU_IMPORT_MAX_ROWS + 1), start=1):
+        try:
+            row = {
+                key: value
+                for key, value in record.items()
+                if key in ("name", "description", "rating", "is_available") and value != ""
+            }
+            row["variants"] = [
+                {"name": name, "price": price}
+                for name, price in _split_pairs(record.get("variants"))
+            ]
+            row["specifications"] = [
+                {"label": label, "value": value}
+                for label, value in _split_pairs(record.get("specifications"))
+            ]
+        except ValueError as e:
+            errors.append({"row": index, "errors": [{"loc": [], "msg": str(e)}]})
+            row = None
+
+        rows.append(row)
+
+    return rows, errors
+
+
+def _split_pairs(cell):
+    if not cell:
+        return []
+
+    pairs = []
+    for part in cell.split("|"):
+        key, sep, value = part.partition(":")
+        if not sep:
+            raise ValueError(f"Expected 'key:value' but got '{part}'")
+        pairs.append((key.strip(), value.strip()))
+
+    return pairs
+
+
+def _insert_menu_items(db: Session, restaurant: Restaurant, items: list):
+    restaurant_id = restaurant.id
+
+    if not items:
+        return {"restaurant_id": restaurant_id, "imported": 0, "food_item_ids": []}
+
+    # Multi-row INSERT ... RETURNING, ids come back in input order
+    item_ids = db.execute(
+        insert(FoodItem).returning(FoodItem.id, sort_by_parameter_order=True),
+        [
+            {
+                "name": item.name,
+                "description": item.description,
+                "rating": item.rating,
+                "is_available": item.is_available,
+                "restaurant_id": restaurant_id
+            }
+            for item in items
+        ]
+    ).scalars().all()
+
+    variant_rows = [
+        {"name": variant.name, "price": variant.price, "position": position, "food_item_id": item_id}
+        for item, item_id in zip(items, item_ids)
+        for position, variant in enumerate(item.variants)
     ]
+    if variant_rows:
+        db.execute(insert(FoodVariant), variant_rows)
+
+    spec_rows = [
+        {"label": spec.label, "value": spec.value, "position": position, "food_item_id": item_id}
+        for item, item_id in zip(items, item_ids)
+        for position, spec in enumerate(item.specifications)
+    ]
+    if spec_rows:
+        db.execute(insert(FoodSpecification), spec_rows)
+
+    db.commit()
+
+    menu_cache.bump(restaurant_id)
+    search_cache.invalidate_point(restaurant.latitude, restaurant.longitude)
+    for item, item_id in zip(items, item_ids):
+        food_name_index.upsert_item(
+            item_id,
+            item.name,
+            restaurant.latitude,
+            restaurant.longitude,
+            item.is_available and restaurant.is_active
+        )
 
     return {
-        "restaurant_id": restaurant.id,
-        "restaurant_name": restaurant.name,
-        "phone": restaurant.phone,
-        "latitude": restaurant.latitude,
-        "longitude": restaurant.longitude,
-        "menu": available_items
-    }
\ No newline at end of file
+        "restaurant_id": restaurant_id,
+        "imported": len(item_ids),
+        "food_item_ids": item_ids
+    }
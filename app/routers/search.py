@@ -1,10 +1,21 @@
-from fastapi import APIRouter, Depends, Query
+import json
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func, literal, or_, select, union_all
 
-from app.core.database import get_db
+from app.core.database import NDJSON_MEDIA_TYPE, get_async_db, get_db, run_db, stream_rows
+from app.core.geo import GEO_INDEX_ENABLED, bounding_box, distance_km, restaurant_index
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.search_cache import SEARCH_CACHE_ENABLED, SEARCH_CACHE_MAX_ROWS, search_cache
+from app.core.suggest import SUGGEST_MAX_LIMIT, food_name_index
 from app.models.restaurant import Restaurant
 from app.models.menu_item import FoodItem
+from app.models.food_variant import FoodVariant
+from app.schemas.search import SearchBatchRequest
 
 
 router = APIRouter(
@@ -12,50 +23,460 @@ router = APIRouter(
     tags=["Search"]
 )
 
+SEARCH_STREAM_CHUNK_SIZE = int(os.getenv("SEARCH_STREAM_CHUNK_SIZE", 500))
+
+# Cached pages measure distance in Python, uncached ones in SQL, and the
+# two can disagree in the last bits. Cursor comparisons allow this much
+# slack so a cursor from either path resumes after the same row.
+SEARCH_CURSOR_TOLERANCE_KM = 1e-9
+
 
 # -------------------------
 # SEARCH API (Geo + Pagination)
 # -------------------------
 @router.get("/search")
-def search_food(
+async def search_food(
+    request: Request,
     food: str = Query(...),
     lat: float = Query(...),
     lng: float = Query(...),
     radius: float = Query(...),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    db = Depends(get_async_db)
 ):
 
-    offset = (page - 1) * limit
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        statement = await run_db(db, _stream_statement, food, lat, lng, radius)
 
-    # Haversine distance formula
-    distance_formula = (
-        6371 * func.acos(
-            func.least(
-                1,
-                func.greatest(
-                    -1,
-                    func.cos(func.radians(lat)) *
-                    func.cos(func.radians(Restaurant.latitude)) *
-                    func.cos(func.radians(Restaurant.longitude) - func.radians(lng)) +
-                    func.sin(func.radians(lat)) *
-                    func.sin(func.radians(Restaurant.latitude))
+        return StreamingResponse(
+            stream_rows(db, statement, _ndjson_line, SEARCH_STREAM_CHUNK_SIZE),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+
+    if SEARCH_CACHE_ENABLED:
+        matches = (await _cached_matches(db, [food], lat, lng, radius))[food]
+        if matches is not None:
+            return _page_matches(matches, lat, lng, radius, page, limit, cursor, include_total)
+
+    return await run_db(
+        db, _search, food, lat, lng, radius, page, limit, cursor, include_total
+    )
+
+
+async def _cached_matches(db, foods: list[str], lat: float, lng: float, radius: float) -> dict:
+    """
+    Every match within reach of the search's cache cell, per term.
+
+    Terms with more than SEARCH_CACHE_MAX_ROWS matches map to None and
+    are left to the exact queries. They are cached as (total, None), so
+    later searches skip straight to those queries.
+    """
+    q_lat, q_lng, q_radius = search_cache.quantize(lat, lng, radius)
+    reach = search_cache.reach_km(q_lat, q_lng, q_radius)
+
+    matches = {}
+    keys = {}
+    pending = []
+    for food in foods:
+        keys[food] = search_cache.key(food, q_lat, q_lng, q_radius)
+        entry = search_cache.get(keys[food])
+
+        if entry is None:
+            pending.append(food)
+        else:
+            matches[food] = entry[1]
+
+    if pending:
+        loaded = await run_db(
+            db, _search_many, pending, q_lat, q_lng, reach,
+            SEARCH_CACHE_MAX_ROWS, SEARCH_CACHE_MAX_ROWS
+        )
+
+        for food, (total_results, rows) in loaded.items():
+            if total_results > SEARCH_CACHE_MAX_ROWS:
+                rows = None
+
+            matches[food] = rows
+            search_cache.put(keys[food], (total_results, rows), q_lat, q_lng, reach)
+
+    return matches
+
+
+def _page_matches(
+    matches: list,
+    lat: float,
+    lng: float,
+    radius: float,
+    page: Optional[int],
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+) -> dict:
+    """/search response from cached matches, against the exact point and radius."""
+    hits = []
+    for row in matches:
+        distance = distance_km(lat, lng, row.latitude, row.longitude)
+        if distance <= radius:
+            hits.append((distance, row.food_item_id, row))
+
+    hits.sort(key=lambda hit: hit[:2])
+
+    total_results = None
+    total_pages = None
+
+    if include_total:
+        total_results = len(hits)
+        total_pages = (total_results + limit - 1) // limit if total_results > 0 else 0
+
+    if cursor is not None:
+        after_distance, after_id = decode_cursor(cursor, float, int)
+        hits = [
+            hit for hit in hits
+            if hit[0] > after_distance + SEARCH_CURSOR_TOLERANCE_KM
+            or (hit[0] >= after_distance - SEARCH_CURSOR_TOLERANCE_KM and hit[1] > after_id)
+        ]
+        page = None
+        offset = 0
+    else:
+        offset = (page - 1) * limit
+
+    hits = hits[offset:offset + limit + 1]
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor(*hits[-1][:2])
+
+    return {
+        "page": page,
+        "limit": limit,
+        "total_results": total_results,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+        "results": [
+            _result(
+                row.restaurant_id,
+                row.restaurant_name,
+                row.food_item_id,
+                distance,
+                row.food_name,
+                row.starting_price
+            )
+            for distance, _, row in hits
+        ]
+    }
+
+
+def _search(
+    db: Session,
+    food: str,
+    lat: float,
+    lng: float,
+    radius: float,
+    page: Optional[int],
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+):
+
+    # Cursor mode resumes after (distance, food_item_id), page mode uses OFFSET
+    if cursor is not None:
+        after_distance, after_id = decode_cursor(cursor, float, int)
+        page = None
+        offset = 0
+    else:
+        offset = (page - 1) * limit
+
+    # Narrow to restaurants in grid cells around the search radius
+    candidate_ids = _candidate_ids(db, lat, lng, radius)
+
+    if candidate_ids == []:
+        return {
+            "page": page,
+            "limit": limit,
+            "total_results": 0 if include_total else None,
+            "total_pages": 0 if include_total else None,
+            "next_cursor": None,
+            "results": []
+        }
+
+    distance_formula = _distance_formula(lat, lng)
+    base_query = _search_query(db, food, lat, lng, radius, candidate_ids, distance_formula)
+
+    total_results = None
+    total_pages = None
+
+    if include_total:
+        total_results = base_query.count()
+        total_pages = (total_results + limit - 1) // limit if total_results > 0 else 0
+
+    if cursor is not None:
+        base_query = base_query.filter(
+            or_(
+                distance_formula > after_distance + SEARCH_CURSOR_TOLERANCE_KM,
+                and_(
+                    distance_formula >= after_distance - SEARCH_CURSOR_TOLERANCE_KM,
+                    FoodItem.id > after_id
                 )
             )
         )
+
+    paginated_query = (
+        base_query
+        .order_by(distance_formula.asc(), FoodItem.id.asc())
+        .limit(limit + 1)
+        .offset(offset)
+    )
+
+    results = paginated_query.all()
+
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        last = results[-1]
+        next_cursor = encode_cursor(last.distance, last[2])
+
+    response = [_result(*row) for row in results]
+
+    return {
+        "page": page,
+        "limit": limit,
+        "total_results": total_results,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+        "results": response
+    }
+
+
+def _stream_statement(db: Session, food: str, lat: float, lng: float, radius: float):
+    """
+    Statement for streaming every match, or None when nothing is in range.
+
+    Rows are not sorted, so the first bytes go out before the database
+    has the full result.
+    """
+    candidate_ids = _candidate_ids(db, lat, lng, radius)
+    if candidate_ids == []:
+        return None
+
+    distance_formula = _distance_formula(lat, lng)
+    query = _search_query(db, food, lat, lng, radius, candidate_ids, distance_formula)
+
+    return query.statement
+
+
+def _ndjson_line(row) -> str:
+    return json.dumps(_result(*row)) + "\n"
+
+
+# -------------------------
+# SUGGEST API (Autocomplete)
+# -------------------------
+@router.get("/search/suggest")
+def suggest_food(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=SUGGEST_MAX_LIMIT),
+    lat: Optional[float] = Query(None),
+    lng: Optional[float] = Query(None),
+    db: Session = Depends(get_db)
+):
+
+    # Served from memory, the database is only read when the index loads
+    food_name_index.ensure_loaded(db)
+
+    return {
+        "query": q,
+        "suggestions": food_name_index.suggest(q, limit, lat, lng)
+    }
+
+
+# -------------------------
+# BATCH SEARCH API (Shared Location)
+# -------------------------
+@router.post("/search/batch")
+async def search_food_batch(
+    batch: SearchBatchRequest,
+    db = Depends(get_async_db)
+):
+
+    lat, lng, radius = batch.lat, batch.lng, batch.radius
+    foods = list(dict.fromkeys(batch.foods))
+
+    # Each term's answer equals /search page 1, so share its cache entries
+    responses = {}
+    if SEARCH_CACHE_ENABLED:
+        cached = await _cached_matches(db, foods, lat, lng, radius)
+        for food, matches in cached.items():
+            if matches is not None:
+                responses[food] = _page_matches(matches, lat, lng, radius, 1, batch.limit, None, True)
+
+    pending = [food for food in foods if food not in responses]
+    if pending:
+        computed = await run_db(db, _search_many, pending, lat, lng, radius, batch.limit + 1)
+
+        for food, (total_results, rows) in computed.items():
+            responses[food] = _first_page(total_results, rows, batch.limit)
+
+    return {
+        "searches": [
+            {"food": food, **responses[food]}
+            for food in batch.foods
+        ]
+    }
+
+
+def _search_many(
+    db: Session,
+    foods: list[str],
+    lat: float,
+    lng: float,
+    radius: float,
+    rows_per_term: int,
+    max_total: Optional[int] = None,
+) -> dict:
+    """
+    Nearest matches for several terms in one query.
+
+    Returns {food: (total_results, rows)}, with rows ordered as /search
+    orders them and cut at ``rows_per_term``. Counts and ranks are window
+    functions partitioned by term, so only the kept rows leave the
+    database. Terms with more than ``max_total`` matches return their
+    nearest row only, enough to report the total.
+    """
+    candidate_ids = _candidate_ids(db, lat, lng, radius)
+    if candidate_ids == []:
+        return {food: (0, []) for food in foods}
+
+    terms = union_all(*[
+        select(literal(index).label("term"), literal(f"%{food}%").label("pattern"))
+        for index, food in enumerate(foods)
+    ]).cte("terms")
+
+    distance_formula = _distance_formula(lat, lng)
+
+    matches = (
+        select(
+            terms.c.term,
+            Restaurant.id.label("restaurant_id"),
+            Restaurant.name.label("restaurant_name"),
+            Restaurant.latitude,
+            Restaurant.longitude,
+            FoodItem.id.label("food_item_id"),
+            FoodItem.name.label("food_name"),
+            distance_formula.label("distance"),
+            func.row_number().over(
+                partition_by=terms.c.term,
+                order_by=(distance_formula, FoodItem.id)
+            ).label("rank"),
+            func.count().over(partition_by=terms.c.term).label("total")
+        )
+        .select_from(Restaurant)
+        .join(FoodItem, FoodItem.restaurant_id == Restaurant.id)
+        .join(terms, FoodItem.name.ilike(terms.c.pattern))
+        .where(
+            *_bounding_box_filters(lat, lng, radius),
+            FoodItem.is_available == True,
+            Restaurant.is_active == True,
+            distance_formula <= radius
+        )
     )
 
-    base_query = (
+    if candidate_ids is not None:
+        matches = matches.where(Restaurant.id.in_(candidate_ids))
+
+    matches = matches.subquery()
+
+    # Cheapest variant only for the rows that are kept
+    starting_price = (
+        select(func.min(FoodVariant.price))
+        .where(FoodVariant.food_item_id == matches.c.food_item_id)
+        .scalar_subquery()
+    )
+
+    kept = matches.c.rank <= rows_per_term
+    if max_total is not None:
+        kept = or_(matches.c.rank == 1, and_(kept, matches.c.total <= max_total))
+
+    rows = db.execute(
+        select(matches, starting_price.label("starting_price"))
+        .where(kept)
+        .order_by(matches.c.term, matches.c.rank)
+    ).all()
+
+    totals = {food: 0 for food in foods}
+    kept = {food: [] for food in foods}
+    for row in rows:
+        food = foods[row.term]
+        totals[food] = row.total
+        kept[food].append(row)
+
+    return {food: (totals[food], kept[food]) for food in foods}
+
+
+def _first_page(total_results: int, rows: list, limit: int) -> dict:
+    """/search page 1 from ``_search_many`` output fetched with ``limit + 1`` rows."""
+    total_pages = (total_results + limit - 1) // limit if total_results > 0 else 0
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].distance, rows[-1].food_item_id)
+
+    return {
+        "page": 1,
+        "limit": limit,
+        "total_results": total_results,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+        "results": [
+            _result(
+                row.restaurant_id,
+                row.restaurant_name,
+                row.food_item_id,
+                row.distance,
+                row.food_name,
+                row.starting_price
+            )
+            for row in rows
+        ]
+    }
+
+
+def _result(restaurant_id, restaurant_name, food_item_id, distance, food_name, starting_price) -> dict:
+    return {
+        "restaurant_id": restaurant_id,
+        "restaurant_name": restaurant_name,
+        "food_item_id": food_item_id,
+        "food_name": food_name,
+        "distance_km": round(distance, 2) if distance else 0,
+        "starting_price": starting_price
+    }
+
+
+def _search_query(
+    db: Session,
+    food: str,
+    lat: float,
+    lng: float,
+    radius: float,
+    candidate_ids,
+    distance_formula,
+):
+    query = (
         db.query(
             Restaurant.id,
             Restaurant.name,
             FoodItem.id,
             distance_formula.label("distance"),
-            FoodItem
+            FoodItem.name,
+            _starting_price(db).label("starting_price")
         )
         .join(FoodItem, FoodItem.restaurant_id == Restaurant.id)
         .filter(
+            *_bounding_box_filters(lat, lng, radius),
             FoodItem.name.ilike(f"%{food}%"),
             FoodItem.is_available == True,
             Restaurant.is_active == True
@@ -63,37 +484,63 @@ def search_food(
         .filter(distance_formula <= radius)
     )
 
-    total_results = base_query.count()
+    if candidate_ids is not None:
+        query = query.filter(Restaurant.id.in_(candidate_ids))
 
-    total_pages = (total_results + limit - 1) // limit if total_results > 0 else 0
+    return query
 
-    paginated_query = (
-        base_query
-        .order_by(distance_formula.asc())
-        .limit(limit)
-        .offset(offset)
+
+def _candidate_ids(db: Session, lat: float, lng: float, radius: float):
+    """Restaurant ids from the in-process grid, or None to rely on the bounding box alone."""
+    if not GEO_INDEX_ENABLED:
+        return None
+
+    restaurant_index.ensure_loaded(db)
+    return restaurant_index.candidates(lat, lng, radius)
+
+
+def _distance_formula(lat: float, lng: float):
+
+    # Haversine distance formula
+    return (
+        6371 * func.acos(
+            func.least(
+                1,
+                func.greatest(
+                    -1,
+                    func.cos(func.radians(lat)) *
+                    func.cos(func.radians(Restaurant.latitude)) *
+                    func.cos(func.radians(Restaurant.longitude) - func.radians(lng)) +
+                    func.sin(func.radians(lat)) *
+                    func.sin(func.radians(Restaurant.latitude))
+                )
+            )
+        )
     )
 
-    results = paginated_query.all()
 
-    response = []
+def _bounding_box_filters(lat: float, lng: float, radius: float) -> list:
+
+    # Indexable bounding box, exact distance only runs on rows inside it
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
 
-    for restaurant_id, restaurant_name, food_item_id, distance, item in results:
-        starting_price = min([v.price for v in item.variants]) if item.variants else None
+    box_filters = [Restaurant.latitude.between(min_lat, max_lat)]
+    if min_lng is not None and min_lng <= max_lng:
+        box_filters.append(Restaurant.longitude.between(min_lng, max_lng))
+    elif min_lng is not None:
+        box_filters.append(
+            or_(Restaurant.longitude >= min_lng, Restaurant.longitude <= max_lng)
+        )
 
-        response.append({
-            "restaurant_id": restaurant_id,
-            "restaurant_name": restaurant_name,
-            "food_item_id": food_item_id,
-            "food_name": item.name,
-            "distance_km": round(distance, 2) if distance else 0,
-            "starting_price": starting_price
-        })
+    return box_filters
 
-    return {
-        "page": page,
-        "limit": limit,
-        "total_results": total_results,
-        "total_pages": total_pages,
-        "results": response
-    }
\ No newline at end of file
+
+def _starting_price(db: Session):
+
+    # Cheapest variant per item, computed in the same query
+    return (
+        db.query(func.min(FoodVariant.price))
+        .filter(FoodVariant.food_item_id == FoodItem.id)
+        .correlate(FoodItem)
+        .scalar_subquery()
+    )
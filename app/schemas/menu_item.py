@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 # -------------------------
@@ -52,6 +52,18 @@ class MenuItemCreate(BaseModel):
     specifications: List[FoodSpecificationCreate]
 
 
+# -------------------------
+# Bulk Import Row
+# -------------------------
+class MenuItemImport(BaseModel):
+    name: str
+    description: str
+    rating: float = 0.0
+    is_available: bool = True
+    variants: List[FoodVariantCreate] = []
+    specifications: List[FoodSpecificationCreate] = []
+
+
 # -------------------------
 # Update Food Item
 # -------------------------
@@ -65,6 +77,14 @@ class MenuItemUpdate(BaseModel):
     specifications: Optional[List[FoodSpecificationCreate]] = None
 
 
+# -------------------------
+# Bulk Availability Toggle
+# -------------------------
+class MenuAvailabilityUpdate(BaseModel):
+    # food_item_id -> is_available
+    items: Dict[int, bool] = Field(..., min_length=1, max_length=1000)
+
+
 # -------------------------
 # Food Item Response
 # -------------------------
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+# -------------------------
+# Batch Search Request
+# -------------------------
+class SearchBatchRequest(BaseModel):
+    foods: List[str] = Field(..., min_length=1, max_length=20)
+    lat: float
+    lng: float
+    radius: float
+    limit: int = Field(10, ge=1, le=100)
@@ -0,0 +1,185 @@
+"""
+Compare menu loading strategies for GET /restaurants/{id}/menu.
+
+Seeds an in-memory SQLite database with menus of different sizes and
+reports, for each strategy, the statements issued, the rows the
+database returned, the median load time and the peak memory allocated
+while loading.
+
+    python benchmarks/bench_menu_loading.py
+"""
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import joinedload, selectinload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.user import User
+from app.models.restaurant import Restaurant
+from app.models.menu_item import FoodItem
+from app.models.food_variant import FoodVariant
+from app.models.food_specification import FoodSpecification
+from app.routers.restaurant import _load_restaurant_menu
+
+
+MENU_SIZES = [20, 200, 1000]
+VARIANTS_PER_ITEM = 5
+SPECS_PER_ITEM = 6
+REPEATS = 5
+
+
+# -------------------------
+# Strategies
+# -------------------------
+def load_joined(db, restaurant_id):
+    """Previous strategy: two joinedload chains in a single query."""
+    restaurant = (
+        db.query(Restaurant)
+        .options(
+            joinedload(Restaurant.menu_items)
+            .joinedload(FoodItem.variants),
+            joinedload(Restaurant.menu_items)
+            .joinedload(FoodItem.specifications)
+        )
+        .filter(Restaurant.id == restaurant_id)
+        .first()
+    )
+    return [item for item in restaurant.menu_items if item.is_available]
+
+
+def load_selectin(db, restaurant_id):
+    """ORM strategy: one selectinload query per collection."""
+    return (
+        db.query(FoodItem)
+        .options(
+            selectinload(FoodItem.variants),
+            selectinload(FoodItem.specifications)
+        )
+        .filter(
+            FoodItem.restaurant_id == restaurant_id,
+            FoodItem.is_available == True
+        )
+        .order_by(FoodItem.id)
+        .all()
+    )
+
+
+def load_rows(db, restaurant_id):
+    """Current strategy used by the menu endpoint: plain rows, no ORM objects."""
+    return _load_restaurant_menu(db, restaurant_id)["menu"]
+
+
+STRATEGIES = [
+    ("joinedload", load_joined),
+    ("selectinload", load_selectin),
+    ("rows", load_rows)
+]
+
+
+# -------------------------
+# Setup
+# -------------------------
+def seed(db, menu_size):
+    owner = User(name="bench", email="bench@example.com", phone="0", password_hash="x")
+    db.add(owner)
+    db.flush()
+
+    restaurant = Restaurant(
+        name="Bench", address="-", phone="0",
+        latitude=12.97, longitude=77.59, owner_id=owner.id
+    )
+    db.add(restaurant)
+    db.flush()
+
+    for i in range(menu_size):
+        item = FoodItem(
+            name=f"Item {i}", description="-", rating=4.0,
+            is_available=i % 10 != 0, restaurant_id=restaurant.id
+        )
+        item.variants = [
+            FoodVariant(name=f"V{v}", price=100 + v) for v in range(VARIANTS_PER_ITEM)
+        ]
+        item.specifications = [
+            FoodSpecification(label=f"L{s}", value="-") for s in range(SPECS_PER_ITEM)
+        ]
+        db.add(item)
+
+    db.commit()
+    return restaurant.id
+
+
+def measure(engine, Session, strategy, restaurant_id):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    db = Session()
+    try:
+        strategy(db, restaurant_id)
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", capture)
+
+    # Re-run the captured statements to count the rows each one returned
+    raw = engine.raw_connection()
+    try:
+        rows = sum(len(raw.cursor().execute(s, p).fetchall()) for s, p in statements)
+    finally:
+        raw.close()
+
+    timings = []
+    for _ in range(REPEATS):
+        db = Session()
+        start = time.perf_counter()
+        strategy(db, restaurant_id)
+        timings.append(time.perf_counter() - start)
+        db.close()
+
+    db = Session()
+    tracemalloc.start()
+    try:
+        strategy(db, restaurant_id)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        db.close()
+
+    return len(statements), rows, statistics.median(timings) * 1000, peak / 1024
+
+
+def main():
+    print(f"{'items':>6} {'strategy':>13} {'queries':>8} {'rows':>8} {'ms':>9} {'peak KiB':>9}")
+
+    for menu_size in MENU_SIZES:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        db = Session()
+        restaurant_id = seed(db, menu_size)
+        db.close()
+
+        for name, strategy in STRATEGIES:
+            queries, rows, ms, kib = measure(engine, Session, strategy, restaurant_id)
+            print(f"{menu_size:>6} {name:>13} {queries:>8} {rows:>8} {ms:>9.1f} {kib:>9.0f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import json
+from collections import namedtuple
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.fast_json import FastJSONResponse, dumps, menu_item_payload, restaurant_menu_payload
+from app.schemas.menu_item import MenuItemResponse
+from app.schemas.restaurant_menu import RestaurantMenuResponse
+
+
+RestaurantRow = namedtuple("RestaurantRow", "id name phone latitude longitude")
+ItemRow = namedtuple(
+    "ItemRow", "id name description rating is_available restaurant_id created_at"
+)
+VariantRow = namedtuple("VariantRow", "id name price food_item_id")
+SpecRow = namedtuple("SpecRow", "id label value food_item_id")
+
+RESTAURANT = RestaurantRow(7, "Café Ñandú", "98450", 12.9716, 77)
+ITEMS = [
+    ItemRow(1, "Paneer Tikka", "Smoky", 4, True, 7, datetime(2026, 3, 17, 12, 45, 36, 197021)),
+    ItemRow(2, "Masala Chai", "", 0.0, 1, 7, datetime(2026, 3, 17, 12, 45)),
+]
+VARIANTS = [
+    VariantRow(10, "Half", 120, 1),
+    VariantRow(11, "Full", 219.5, 1),
+    VariantRow(12, "Cup", 19.99, 2),
+]
+SPECS = [SpecRow(20, "Spice", "Hot", 1)]
+
+
+def reference_item(item):
+    return {
+        **item._asdict(),
+        "variants": [v._asdict() for v in VARIANTS if v.food_item_id == item.id],
+        "specifications": [s._asdict() for s in SPECS if s.food_item_id == item.id],
+    }
+
+
+def test_menu_item_response_matches_default_response():
+    for item in ITEMS:
+        variants = [v for v in VARIANTS if v.food_item_id == item.id]
+        specs = [s for s in SPECS if s.food_item_id == item.id]
+
+        # What the route sent before FAST_JSON_ENABLED
+        model = MenuItemResponse.model_validate(reference_item(item))
+        expected = JSONResponse(jsonable_encoder(model))
+
+        response = FastJSONResponse(menu_item_payload(item, variants, specs))
+
+        assert json.loads(response.body) == json.loads(expected.body)
+        assert response.body == expected.body
+        assert response.headers.items() == expected.headers.items()
+
+
+def test_restaurant_menu_payload_matches_response_model():
+    # The menu route sends model_dump_json bytes unless FAST_JSON_ENABLED
+    expected = RestaurantMenuResponse.model_validate({
+        "restaurant_id": RESTAURANT.id,
+        "restaurant_name": RESTAURANT.name,
+        "phone": RESTAURANT.phone,
+        "latitude": RESTAURANT.latitude,
+        "longitude": RESTAURANT.longitude,
+        "menu": [reference_item(item) for item in ITEMS],
+    }).model_dump_json()
+
+    payload = restaurant_menu_payload(RESTAURANT, ITEMS, VARIANTS, SPECS)
+
+    assert dumps(payload) == expected.encode()
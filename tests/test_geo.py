@@ -0,0 +1,65 @@
+from app.core.geo import RestaurantGeoIndex, bounding_box, cell_of, distance_km
+
+
+def test_candidates_within_radius():
+    index = RestaurantGeoIndex(cell_deg=0.05, refresh_seconds=300, max_candidates=100)
+    index.upsert(1, 12.9716, 77.5946)
+    index.upsert(2, 12.9352, 77.6245)
+    index.upsert(3, 13.3409, 77.1010)
+
+    assert sorted(index.candidates(12.97, 77.59, 10)) == [1, 2]
+    assert index.candidates(12.97, 77.59, 1) == [1]
+
+
+def test_upsert_moves_and_deactivates():
+    index = RestaurantGeoIndex(cell_deg=0.05, refresh_seconds=300, max_candidates=100)
+    index.upsert(1, 12.9716, 77.5946)
+
+    index.upsert(1, 28.6139, 77.2090)
+    assert index.candidates(12.97, 77.59, 10) == []
+    assert index.candidates(28.61, 77.21, 10) == [1]
+
+    index.upsert(1, 28.6139, 77.2090, is_active=False)
+    assert index.candidates(28.61, 77.21, 10) == []
+
+
+def test_candidates_across_antimeridian():
+    index = RestaurantGeoIndex(cell_deg=0.05, refresh_seconds=300, max_candidates=100)
+    index.upsert(1, -16.5, 179.99)
+
+    assert index.candidates(-16.5, -179.99, 5) == [1]
+    assert distance_km(-16.5, -179.99, -16.5, 179.99) < 5
+
+
+def test_bounding_box_contains_radius():
+    min_lat, max_lat, min_lng, max_lng = bounding_box(12.97, 77.59, 10)
+
+    assert min_lat < 12.97 < max_lat
+    assert min_lng < 77.59 < max_lng
+    assert distance_km(12.97, 77.59, max_lat, 77.59) >= 10
+    assert distance_km(12.97, 77.59, 12.97, max_lng) >= 10
+
+
+def test_too_many_candidates_falls_back_to_bounding_box():
+    index = RestaurantGeoIndex(cell_deg=0.05, refresh_seconds=300, max_candidates=2)
+    index.upsert(1, 12.9716, 77.5946)
+    index.upsert(2, 12.9352, 77.6245)
+    index.upsert(3, 12.9500, 77.6000)
+
+    assert index.candidates(12.97, 77.59, 1) == [1]
+    assert index.candidates(12.97, 77.59, 10) is None
+
+
+def test_writes_during_a_reload_survive_the_swap():
+    index = RestaurantGeoIndex(cell_deg=0.05, refresh_seconds=300, max_candidates=100)
+    index.upsert(1, 12.9716, 77.5946)
+
+    def build_racing_a_write(db):
+        index.upsert(2, 12.9352, 77.6245)
+        index.remove(1)
+        return {1: (12.9716, 77.5946)}, {cell_of(12.9716, 77.5946, 0.05): {1}}
+
+    index._build = build_racing_a_write
+    index.ensure_loaded(db=None)
+
+    assert index.candidates(12.97, 77.59, 10) == [2]
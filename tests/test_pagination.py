@@ -0,0 +1,24 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(1.1119492604640566, 42)
+    assert decode_cursor(cursor, float, int) == [1.1119492604640566, 42]
+
+
+def test_invalid_cursor_rejected():
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("not-a-cursor", float, int)
+
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("values", [("x", {}), (1.5, 2.5), (True, 1), (float("inf"), 1), (1.5,)])
+def test_cursor_with_wrong_types_rejected(values):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(encode_cursor(*values), float, int)
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.password_pool import PasswordHashPool
+
+
+def test_pool_rejects_jobs_past_its_queue():
+    pool = PasswordHashPool(workers=1, max_queue=1, retry_after=3)
+    release = threading.Event()
+
+    async def main():
+        running = asyncio.ensure_future(pool.run("hash", release.wait))
+        queued = asyncio.ensure_future(pool.run("hash", lambda: "queued"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as error:
+            await pool.run("hash", lambda: "rejected")
+
+        release.set()
+        return error.value, await running, await queued
+
+    error, running, queued = asyncio.run(main())
+
+    assert error.status_code == 503
+    assert error.headers == {"Retry-After": "3"}
+    assert (running, queued) == (True, "queued")
+
+
+def test_pool_admits_again_once_jobs_finish():
+    pool = PasswordHashPool(workers=1, max_queue=0, retry_after=1)
+
+    async def main():
+        return [await pool.run("verify", lambda n=n: n) for n in range(3)]
+
+    assert asyncio.run(main()) == [0, 1, 2]
+
+
+def test_cancelled_queued_job_frees_its_slot():
+    pool = PasswordHashPool(workers=1, max_queue=1, retry_after=1)
+    release = threading.Event()
+
+    async def main():
+        running = asyncio.ensure_future(pool.run("hash", release.wait))
+        queued = asyncio.ensure_future(pool.run("hash", lambda: "queued"))
+        await asyncio.sleep(0)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await asyncio.sleep(0)
+
+        admitted = asyncio.ensure_future(pool.run("hash", lambda: "admitted"))
+        await asyncio.sleep(0)
+
+        release.set()
+        return await running, await admitted
+
+    assert asyncio.run(main()) == (True, "admitted")
+    assert (pool._admitted, pool._queued) == (0, 0)
@@ -0,0 +1,43 @@
+from sqlalchemy import inspect
+
+from app.core.principal_cache import PrincipalCache
+from app.models.user import User
+
+
+def make_user(**values):
+    return User(id=1, name="o", email="o@x.com", phone="1", password_hash="secret", role="owner", **values)
+
+
+def test_hit_returns_detached_copy_without_secret_or_revocation_state():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put(make_user(), cache.epoch())
+
+    user = cache.get(1)
+
+    assert (user.id, user.email) == (1, "o@x.com")
+    assert (user.password_hash, user.role, user.token_generation) == (None, None, None)
+    assert inspect(user).transient
+
+
+def test_invalidate_drops_entry_and_stale_loads():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put(make_user(), cache.epoch())
+
+    epoch = cache.epoch()
+    cache.invalidate(1)
+    cache.put(make_user(), epoch)
+
+    assert cache.get(1) is None
+
+
+def test_expired_and_evicted_entries_miss():
+    cache = PrincipalCache(max_entries=1, ttl_seconds=0)
+    cache.put(make_user(), cache.epoch())
+    assert cache.get(1) is None
+
+    cache = PrincipalCache(max_entries=1, ttl_seconds=60)
+    cache.put(make_user(), cache.epoch())
+    cache.put(User(id=2, name="a"), cache.epoch())
+
+    assert cache.get(1) is None
+    assert cache.get(2).name == "a"
@@ -0,0 +1,22 @@
+from app.core.rate_limit import TokenBucketLimiter
+
+
+def test_bucket_allows_burst_then_refills():
+    limiter = TokenBucketLimiter(burst=3, per_minute=6, max_keys=10)
+
+    assert [limiter.acquire("ip", now=0) for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("ip", now=0) == 10
+
+    assert limiter.acquire("ip", now=10) == 0
+    assert limiter.acquire("other", now=10) == 0
+
+
+def test_least_recent_bucket_is_dropped_past_max_keys():
+    limiter = TokenBucketLimiter(burst=1, per_minute=1, max_keys=2)
+
+    limiter.acquire("a", now=0)
+    limiter.acquire("b", now=0)
+    limiter.acquire("c", now=0)
+
+    assert limiter.acquire("b", now=0) > 0
+    assert limiter.acquire("a", now=0) == 0
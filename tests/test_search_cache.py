@@ -0,0 +1,57 @@
+from app.core.search_cache import SearchCache
+
+
+def make_cache(**overrides):
+    options = dict(
+        max_entries=10,
+        ttl_seconds=60,
+        cell_deg=0.002,
+        radius_step_km=0.5,
+        invalidation_cell_deg=0.05,
+    )
+    options.update(overrides)
+    return SearchCache(**options)
+
+
+def test_invalidate_only_nearby_entries():
+    cache = make_cache()
+    cache.put("bangalore", {"results": []}, 12.97, 77.59, 5)
+    cache.put("delhi", {"results": []}, 28.61, 77.21, 5)
+
+    cache.invalidate_point(12.98, 77.60)
+
+    assert cache.get("bangalore") is None
+    assert cache.get("delhi") == {"results": []}
+
+
+def test_lru_eviction():
+    cache = make_cache(max_entries=2)
+    cache.put("a", 1, 12.97, 77.59, 5)
+    cache.put("b", 2, 12.97, 77.59, 5)
+    cache.get("a")
+    cache.put("c", 3, 12.97, 77.59, 5)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_nearby_searches_share_a_key():
+    cache = make_cache()
+    first = cache.key("Pizza", *cache.quantize(12.9701, 77.5901, 4.8), 1, 10)
+    second = cache.key("pizza", *cache.quantize(12.9703, 77.5903, 5.0), 1, 10)
+
+    assert first == second
+
+
+def test_reach_covers_every_search_from_the_cell():
+    from app.core.geo import distance_km
+
+    cache = make_cache()
+
+    for lat, lng in [(12.9701, 77.5901), (12.9719, 77.5919), (59.9, 10.75)]:
+        q_lat, q_lng, q_radius = cache.quantize(lat, lng, 4.8)
+        reach = cache.reach_km(q_lat, q_lng, q_radius)
+
+        # Anything within the requested radius of the user is within reach of the centre
+        assert distance_km(q_lat, q_lng, lat, lng) + 4.8 <= reach
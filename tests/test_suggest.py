@@ -0,0 +1,57 @@
+from app.core.suggest import FoodNameIndex
+
+
+def test_suggest_ranks_by_item_count():
+    index = FoodNameIndex(cell_deg=0.5, refresh_seconds=300)
+    index.upsert_item(1, "Chicken Biryani", 12.97, 77.59)
+    index.upsert_item(2, "Chicken Biryani", 12.98, 77.60)
+    index.upsert_item(3, "Chicken Burger", 12.97, 77.59)
+    index.upsert_item(4, "Veg Biryani", 12.97, 77.59)
+
+    assert index.suggest("chi", 10) == ["Chicken Biryani", "Chicken Burger"]
+    assert index.suggest("biry", 10) == ["Chicken Biryani", "Veg Biryani"]
+    assert index.suggest("b", 1) == ["Chicken Biryani"]
+
+
+def test_suggest_follows_writes_and_cells():
+    index = FoodNameIndex(cell_deg=0.5, refresh_seconds=300)
+    index.upsert_item(1, "Pizza", 12.97, 77.59)
+    index.upsert_item(2, "Paneer Tikka", 28.61, 77.21)
+
+    assert index.suggest("p", 10, lat=12.9, lng=77.5) == ["Pizza"]
+
+    index.upsert_item(1, "Pizza", 12.97, 77.59, visible=False)
+    assert index.suggest("piz", 10) == []
+
+    index.remove_item(2)
+    assert index.suggest("p", 10) == []
+
+
+def test_bulk_build_matches_incremental_adds():
+    from app.core.suggest import _NameScope
+
+    names = ["Chicken Biryani", "chicken  biryani", "Veg Biryani", "Pizza", ""]
+    incremental = _NameScope()
+    for name in names:
+        incremental.add(name)
+
+    built = _NameScope.build(names)
+
+    assert built.entries == incremental.entries
+    assert built.counts == incremental.counts
+    assert built.display == incremental.display
+
+
+def test_writes_during_a_rebuild_survive_the_swap():
+    index = FoodNameIndex(cell_deg=0.5, refresh_seconds=300)
+    index.upsert_item(1, "Pizza", 12.97, 77.59)
+
+    def build_racing_a_write(db):
+        index.upsert_item(2, "Paneer Tikka", 12.97, 77.59)
+        index.remove_item(1)
+        return {}, FoodNameIndex(0.5, 300)._global, {}
+
+    index._build = build_racing_a_write
+    index.ensure_loaded(db=None)
+
+    assert index.suggest("p", 10) == ["Paneer Tikka"]